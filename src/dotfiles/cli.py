@@ -10,6 +10,7 @@ from rich.tree import Tree
 
 from .core.backup import BackupManager
 from .core.config import Config
+from .core.logging import setup_logging
 from .core.repository import GitRepository
 from .core.restore import RestoreManager
 from .core.wipe import WipeManager
@@ -18,7 +19,12 @@ console = Console()
 
 
 @click.group()
-def cli() -> None:
+@click.option(
+    "--debug",
+    is_flag=True,
+    help="Enable debug logging (also written to /tmp/dotfiles_debug.log)",
+)
+def cli(debug: bool) -> None:
     """Dotfiles management tool.
 
     This tool helps manage configuration files (dotfiles) across multiple repositories.
@@ -35,6 +41,7 @@ def cli() -> None:
 
     Run 'dotfiles COMMAND --help' for more information on a specific command.
     """
+    setup_logging(debug=debug, log_file="/tmp/dotfiles_debug.log" if debug else None)
 
 
 @cli.command()
@@ -148,6 +155,11 @@ def backup(
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be restored without making any changes"
 )
+@click.option(
+    "--hardlink",
+    is_flag=True,
+    help="Hardlink files to the backup instead of copying them (edits then change the backup too)",
+)
 def restore(
     repo_name: str,
     target_dir: Path,
@@ -157,6 +169,7 @@ def restore(
     latest: bool,
     force: bool,
     dry_run: bool,
+    hardlink: bool,
 ) -> None:
     """Restore program configurations from a backup.
 
@@ -203,6 +216,7 @@ def restore(
             latest=latest,
             force=force,
             dry_run=dry_run,
+            hardlink=hardlink,
         ):
             console.print("[red]Error: Failed to restore files")
             raise click.Abort()
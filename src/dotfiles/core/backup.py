@@ -8,8 +8,11 @@ defined in the configuration, with support for glob patterns and exclusions.
 from __future__ import annotations
 
 import glob
+import os
 import shutil
+import stat
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -25,6 +28,39 @@ console = Console()
 EXCLUDED_FILES = [".DS_Store", "Thumbs.db", "desktop.ini", "__pycache__"]
 
 
+def _subdirs(path: str) -> List[str]:
+    """List the subdirectories of a directory.
+
+    Args:
+        path: Directory to list.
+
+    Returns:
+        Paths of the subdirectories, in directory order.
+    """
+    with os.scandir(path) as entries:
+        return [entry.path for entry in entries if entry.is_dir()]
+
+
+def _classify(path: str | Path) -> Tuple[Optional[str], int]:
+    """Classify a path with a single stat call.
+
+    Args:
+        path: Path to classify; symlinks are followed.
+
+    Returns:
+        ("file" or "dir", size), or (None, 0) for missing paths and other kinds.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, 0
+    if stat.S_ISREG(st.st_mode):
+        return "file", st.st_size
+    if stat.S_ISDIR(st.st_mode):
+        return "dir", st.st_size
+    return None, 0
+
+
 class BackupManager:
     """Manages backups of Cursor IDE configuration files.
 
@@ -108,38 +144,27 @@ class BackupManager:
             return paths
 
         for pattern in program_config.get("paths", []):
-            pattern_path = Path(pattern)
-            if "*" in str(pattern_path):
+            pattern_path = repo.path / pattern
+            if "*" in pattern:
                 # Handle glob patterns
-                for matched_path in glob.glob(str(repo.path / pattern_path)):
-                    path = Path(matched_path)
-                    if path.exists():
-                        if path.is_file() and path.stat().st_size > 0:
-                            if path.name not in EXCLUDED_FILES:
-                                paths.add(path)
-                        elif path.is_dir():
-                            for file_path in path.rglob("*"):
-                                if (
-                                    file_path.is_file()
-                                    and file_path.stat().st_size > 0
-                                    and file_path.name not in EXCLUDED_FILES
-                                ):
-                                    paths.add(file_path)
+                candidates = [Path(matched) for matched in glob.glob(str(pattern_path))]
             else:
                 # Handle exact paths
-                path = repo.path / pattern_path
-                if path.exists():
-                    if path.is_file() and path.stat().st_size > 0:
-                        if path.name not in EXCLUDED_FILES:
-                            paths.add(path)
-                    elif path.is_dir():
-                        for file_path in path.rglob("*"):
-                            if (
-                                file_path.is_file()
-                                and file_path.stat().st_size > 0
-                                and file_path.name not in EXCLUDED_FILES
-                            ):
-                                paths.add(file_path)
+                candidates = [pattern_path]
+
+            # One stat per path tells files, directories and sizes apart
+            for path in candidates:
+                kind, size = _classify(path)
+                if kind == "file":
+                    if size > 0 and path.name not in EXCLUDED_FILES:
+                        paths.add(path)
+                elif kind == "dir":
+                    for file_path in path.rglob("*"):
+                        if file_path.name in EXCLUDED_FILES:
+                            continue
+                        kind, size = _classify(file_path)
+                        if kind == "file" and size > 0:
+                            paths.add(file_path)
 
         return paths
 
@@ -324,11 +349,13 @@ class BackupManager:
 
         return True
 
-    def list_backups(self, repo: Optional[str] = None) -> List[Path]:
+    def list_backups(self, repo: Optional[str] = None, root: Optional[Path] = None) -> List[Path]:
         """List available backups.
 
         Args:
             repo: Optional repository name to filter backups.
+            root: Optional directory to resolve a relative backup directory against.
+                Defaults to the dotfiles repository or the current directory.
 
         Returns:
             List of backup paths.
@@ -336,8 +363,10 @@ class BackupManager:
         # Ensure we're using an absolute path for the backup directory
         backup_dir = self.backup_dir
         if not backup_dir.is_absolute():
+            if root is not None:
+                backup_dir = root / backup_dir
             # If we're in the dotfiles repository, use the relative path
-            if Path.cwd().name == "dotfiles":
+            elif Path.cwd().name == "dotfiles":
                 backup_dir = Path.cwd() / backup_dir
             else:
                 # Try to find the dotfiles repository
@@ -358,30 +387,26 @@ class BackupManager:
         if not backup_dir.exists():
             return []
 
-        # Get all backup directories
-        backups = []
+        # Get all backup directories as (name, path) pairs
+        backups: List[Tuple[str, str]] = []
 
         # Structure:
         # backups/[repo]/[branch]/[timestamp]
-        # We want to list all timestamp directories
+        # We want to list all timestamp directories. scandir entries carry the
+        # file type from the directory listing, so no per-entry stat is needed.
 
         # If we're filtering by repo
         if repo:
-            for branch_dir in backup_dir.iterdir():
-                if branch_dir.is_dir():
-                    for timestamp_dir in branch_dir.iterdir():
-                        if timestamp_dir.is_dir():
-                            backups.append(timestamp_dir)
+            branch_roots = [str(backup_dir)]
         else:
             # List all repos
-            for repo_dir in backup_dir.iterdir():
-                if repo_dir.is_dir():
-                    for branch_dir in repo_dir.iterdir():
-                        if branch_dir.is_dir():
-                            for timestamp_dir in branch_dir.iterdir():
-                                if timestamp_dir.is_dir():
-                                    backups.append(timestamp_dir)
-
-        # Sort backups by timestamp (newest first)
-        backups.sort(key=lambda x: x.name, reverse=True)
-        return backups
+            branch_roots = _subdirs(str(backup_dir))
+
+        for branch_root in branch_roots:
+            for branch_dir in _subdirs(branch_root):
+                with os.scandir(branch_dir) as entries:
+                    backups.extend((entry.name, entry.path) for entry in entries if entry.is_dir())
+
+        # Sort backups by timestamp (newest first) on the plain names
+        backups.sort(key=itemgetter(0), reverse=True)
+        return [Path(path) for _, path in backups]
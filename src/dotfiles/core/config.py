@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 
@@ -66,6 +66,11 @@ class Config:
         self.cursor_files: List[str] = []
         self.cursor_directories: List[str] = []
         self.programs: Dict[str, Dict[str, Any]] = {}
+        # (pattern, is_dir, is_glob) entries per program, built on first use
+        self._program_entries: Dict[str, Tuple[Tuple[str, bool, bool], ...]] = {}
+        # Bumped whenever the configuration is (re)loaded, so holders of derived
+        # data can tell it is out of date
+        self.version = 0
         self.load_config()
 
     def load_config(self, config_file: Optional[Path] = None) -> None:
@@ -90,6 +95,9 @@ class Config:
         if not isinstance(config, dict):
             raise ValueError("Configuration must be a dictionary")
 
+        self._program_entries.clear()
+        self.version += 1
+
         # Update the raw config
         self.config.update(config)
 
@@ -217,6 +225,29 @@ class Config:
         """Get configuration for a specific program."""
         return self.programs.get(program)
 
+    def program_entries(self, program: str) -> Tuple[Tuple[str, bool, bool], ...]:
+        """Get the path patterns of a program as flat entries.
+
+        Directories come first, then files. The result is cached until the
+        configuration changes.
+
+        Args:
+            program: Program to get entries for.
+
+        Returns:
+            Tuples of (pattern, is_dir, is_glob); empty for unknown programs.
+        """
+        entries = self._program_entries.get(program)
+        if entries is None:
+            program_config = self.programs.get(program) or {}
+            entries = tuple(
+                (pattern, is_dir, "*" in pattern)
+                for key, is_dir in (("directories", True), ("files", False))
+                for pattern in program_config.get(key, [])
+            )
+            self._program_entries[program] = entries
+        return entries
+
     def load_from_dict(self, config_data: Dict[str, Any]) -> None:
         """Load configuration from a dictionary.
 
@@ -237,6 +268,8 @@ class Config:
             ```
         """
         self.config = config_data
+        self._program_entries.clear()
+        self.version += 1
         if "cursor" in config_data:
             cursor_config = config_data["cursor"]
             self.cursor_files = cursor_config.get("files", [])
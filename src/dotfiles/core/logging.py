@@ -28,8 +28,11 @@ Example:
     ```
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from types import TracebackType
 from typing import Optional, Type
@@ -40,6 +43,17 @@ from rich.logging import RichHandler
 # Create console for rich output
 console = Console()
 
+# Background listener writing queued records to the log file
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the file listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(
     debug: bool = False,
@@ -54,7 +68,9 @@ def setup_logging(
 
     The logging configuration includes:
     - Console handler with rich formatting
-    - Optional file handler with rotation
+    - Optional file handler fed through a queue, so debug records are
+      written by a background thread instead of the calling thread
+    - Warnings and errors only on the console unless debug is enabled
     - Different log levels for console and file
     - Custom format for log messages
     - Module-level loggers
@@ -97,9 +113,10 @@ def setup_logging(
     """
     # Set root logger level
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    root_logger.setLevel(logging.DEBUG if debug else logging.WARNING)
 
     # Remove existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
 
     # Create console handler with rich formatting
@@ -111,7 +128,7 @@ def setup_logging(
         rich_tracebacks=True,
         tracebacks_show_locals=debug,
     )
-    console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
+    console_handler.setLevel(logging.DEBUG if debug else logging.WARNING)
     root_logger.addHandler(console_handler)
 
     # Add file handler if log file specified
@@ -120,11 +137,16 @@ def setup_logging(
         log_path = Path(log_file).expanduser()
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create file handler with rotation
+        # Create file handler, written from a listener thread
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(logging.DEBUG)  # Always log debug to file
         file_handler.setFormatter(logging.Formatter(log_format))
-        root_logger.addHandler(file_handler)
+
+        global _listener
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
 
     # Log initial configuration
     logger = logging.getLogger(__name__)
@@ -160,3 +182,6 @@ def setup_logging(
         )
 
     sys.excepthook = handle_exception
+
+
+atexit.register(_stop_listener)
@@ -4,6 +4,9 @@ import subprocess
 from pathlib import Path
 from typing import List
 
+# Contents of .git/HEAD, up to the branch name, when a branch is checked out
+_HEAD_REF_PREFIX = "ref: refs/heads/"
+
 
 class GitRepository:
     """Represents a Git repository for managing Cursor configuration files.
@@ -147,6 +150,13 @@ class GitRepository:
             print(f"Current branch: {branch}")  # e.g. "main"
             ```
         """
+        # A symbolic HEAD names the branch directly; read it without running git
+        try:
+            head = (self.path / ".git" / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        if head.startswith(_HEAD_REF_PREFIX):
+            return head[len(_HEAD_REF_PREFIX) :]
         return self._run_git("rev-parse", "--abbrev-ref", "HEAD")
 
     def list_branches(self) -> List[str]:
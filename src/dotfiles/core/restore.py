@@ -2,31 +2,456 @@
 
 from __future__ import annotations
 
+import bisect
+import contextlib
+import errno
 import filecmp
+import hashlib
 import logging
+import mmap
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from rich.console import Console
+from rich.live import Live
+from rich.spinner import Spinner
 from rich.table import Table
 
 from .backup import BackupManager
 from .config import Config
 from .repository import GitRepository
 
-console = Console()
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for more detailed logging
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("/tmp/dotfiles_debug.log"),
-        logging.StreamHandler(),
-    ],
-)
+# (pattern, backup path, target path) entries for a program's files and directories
+_PlanEntries = Tuple[Tuple[str, Path, Path], ...]
+_RestorePlan = Tuple[_PlanEntries, _PlanEntries]
+
+# Upper bound on programs validated concurrently
+_VALIDATE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Worker threads used to copy the files of a restored directory
+_RESTORE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Read size used when streaming or comparing file contents
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are compared through mmap instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Keeps raw descriptor copies from translating line endings on Windows
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# ioctl request that clones a file's extents (linux/fs.h)
+_FICLONE = 0x40049409
+
+# copy_file_range errors that mean "not supported here" rather than a failed copy
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EPERM}
+
+# errno values meaning os.sendfile cannot write to a regular file here
+_SENDFILE_UNSUPPORTED = {errno.ENOSYS, errno.EINVAL, errno.ENOTSOCK, errno.EOPNOTSUPP}
+
+
+def _read_write(src_fd: int, dst_fd: int) -> None:
+    """Copy file contents through user space.
+
+    Args:
+        src_fd: Open source file descriptor.
+        dst_fd: Open, empty destination file descriptor.
+    """
+    while True:
+        chunk = os.read(src_fd, _COPY_CHUNK_SIZE)
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+
+
+def _clone(src_fd: int, dst_fd: int) -> bool:
+    """Share the source file's extents with the destination (reflink).
+
+    Args:
+        src_fd: Open source file descriptor.
+        dst_fd: Open, empty destination file descriptor.
+
+    Returns:
+        True if the filesystem cloned the file.
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError:
+        # Not a CoW filesystem, different filesystems, or not Linux
+        return False
+    return True
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy file contents in the kernel with os.copy_file_range.
+
+    Args:
+        src_fd: Open source file descriptor.
+        dst_fd: Open, empty destination file descriptor.
+        size: Size of the source file in bytes.
+
+    Returns:
+        True if the contents were copied, False if the call is unsupported here
+        (nothing has been written in that case).
+    """
+    if not hasattr(os, "copy_file_range"):  # Linux only
+        return False
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(src_fd, dst_fd, max(size - copied, _COPY_CHUNK_SIZE))
+        except OSError as e:
+            if copied == 0 and e.errno in _COPY_RANGE_UNSUPPORTED:
+                return False
+            raise
+        if n == 0:
+            return True
+        copied += n
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy file contents in the kernel with os.sendfile.
+
+    Args:
+        src_fd: Open source file descriptor.
+        dst_fd: Open, empty destination file descriptor.
+        size: Size of the source file in bytes.
+
+    Returns:
+        True if the contents were copied, False if sendfile cannot target a
+        regular file here (nothing has been written in that case).
+    """
+    if not hasattr(os, "sendfile"):
+        return False
+    offset = 0
+    while True:
+        try:
+            n = os.sendfile(dst_fd, src_fd, offset, max(size - offset, _COPY_CHUNK_SIZE))
+        except OSError as e:
+            if offset == 0 and e.errno in _SENDFILE_UNSUPPORTED:
+                return False
+            raise
+        if n == 0:
+            return True
+        offset += n
+
+
+def _copy(src: str | Path, dst: str | Path, exclusive: bool = False) -> None:
+    """Copy a file with metadata, in the kernel where possible.
+
+    Files are cloned (reflink) or copied with os.copy_file_range or os.sendfile,
+    the latter also covering copies across filesystems on older kernels. Only
+    when none of these is available do the contents pass through user space.
+    Both files are opened once, as raw descriptors.
+
+    Args:
+        src: Source file to copy.
+        dst: Destination path to write to.
+        exclusive: Fail with FileExistsError instead of replacing an existing
+            destination; the check and the create are a single atomic open.
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(src_fd).st_size
+        flags = os.O_WRONLY | os.O_CREAT | _O_BINARY | (os.O_EXCL if exclusive else os.O_TRUNC)
+        dst_fd = os.open(dst, flags, 0o666)
+        try:
+            if not (
+                _clone(src_fd, dst_fd)
+                or _copy_range(src_fd, dst_fd, size)
+                or _sendfile(src_fd, dst_fd, size)
+            ):
+                _read_write(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+
+
+def _kind(path: Path) -> Tuple[Optional[str], Optional[os.stat_result]]:
+    """Classify a path with a single stat call.
+
+    Args:
+        path: Path to inspect.
+
+    Returns:
+        Tuple of ("file" | "dir" | "other" | None, stat result). The kind is None
+        when the path does not exist.
+    """
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None, None
+    if stat.S_ISREG(st.st_mode):
+        return "file", st
+    if stat.S_ISDIR(st.st_mode):
+        return "dir", st
+    return "other", st
+
+
+def _top_component(pattern: str) -> Optional[str]:
+    """Get the first path component of a relative pattern.
+
+    Args:
+        pattern: File or directory pattern from a program config.
+
+    Returns:
+        First component, or None if it cannot be determined (absolute or
+        empty patterns).
+    """
+    path = Path(pattern)
+    if not path.parts or path.is_absolute():
+        return None
+    return path.parts[0]
+
+
+def _ensure_dir(path: Path, made: Optional[Set[Path]] = None) -> None:
+    """Create a directory and its parents, skipping ones already created.
+
+    Args:
+        path: Directory to create.
+        made: Directories known to exist, updated with the new ones.
+    """
+    if made is None:
+        path.mkdir(parents=True, exist_ok=True)
+        return
+    if path in made:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    # mkdir(parents=True) guarantees every ancestor exists as well
+    for parent in (path, *path.parents):
+        if parent in made:
+            break
+        made.add(parent)
+
+
+def _scan_tree(root: Path) -> Dict[str, Tuple[int, int]]:
+    """Map every file below a directory to its (size, mtime) signature.
+
+    Entries listed in ``filecmp.DEFAULT_IGNORES`` are skipped, matching ``filecmp.dircmp``.
+    Files are seen the way _iter_files restores them: symlinked files by their
+    target's signature, while symlinked directories and other entries are left out.
+
+    Args:
+        root: Directory to scan.
+
+    Returns:
+        Dictionary keyed by path relative to ``root`` (using ``/`` separators).
+    """
+    signatures: Dict[str, Tuple[int, int]] = {}
+    pending = [("", os.fspath(root))]
+    while pending:
+        prefix, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in filecmp.DEFAULT_IGNORES:
+                    continue
+                rel_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((rel_path + "/", entry.path))
+                elif entry.is_file():
+                    st = entry.stat()
+                    signatures[rel_path] = (st.st_size, st.st_mtime_ns)
+    return signatures
+
+
+def _iter_files(directory: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Walk the files below a directory, like ``Path.rglob("*")`` filtered by ``is_file()``.
+
+    File types come from the scandir entries, so only symlinks need a stat.
+    Symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk.
+        prefix: Relative path of ``directory`` inside the walk, with a trailing separator.
+
+    Yields:
+        Tuples of (path, path relative to the walk's root).
+    """
+    subdirs: List["os.DirEntry[str]"] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry)
+            elif entry.is_file():
+                yield entry.path, prefix + entry.name
+    for entry in subdirs:
+        yield from _iter_files(entry.path, prefix + entry.name + os.sep)
+
+
+def _dirdiff(
+    src: Path, dst: Path, shallow: bool = True
+) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """Compare two directory trees.
+
+    Matching trees are detected from the scandir signatures alone; the sorted
+    difference lists are only built when something differs.
+
+    Args:
+        src: Directory in the backup.
+        dst: Restored directory.
+        shallow: Take files with the same (size, mtime) signature as equal, like
+            ``filecmp.dircmp``. Otherwise every pair of equal-sized files is read.
+
+    Returns:
+        None if the trees match, otherwise sorted lists of
+        (different files, files only in src, files only in dst).
+    """
+    src_tree = _scan_tree(src)
+    dst_tree = _scan_tree(dst)
+    if shallow and src_tree == dst_tree:
+        return None
+
+    # Only read contents where the scanned (size, mtime) signatures disagree;
+    # a size difference alone settles it without touching the files again
+    diff_files = [
+        rel_path
+        for rel_path in src_tree.keys() & dst_tree.keys()
+        if (not shallow or src_tree[rel_path] != dst_tree[rel_path])
+        and (
+            src_tree[rel_path][0] != dst_tree[rel_path][0]
+            or not _same_content(src / rel_path, dst / rel_path, src_tree[rel_path][0])
+        )
+    ]
+    left_only = src_tree.keys() - dst_tree.keys()
+    right_only = dst_tree.keys() - src_tree.keys()
+    if not diff_files and not left_only and not right_only:
+        return None
+    return sorted(diff_files), sorted(left_only), sorted(right_only)
+
+
+def _shallow_equal(a: os.stat_result, b: os.stat_result) -> bool:
+    """Check whether two files have the same (size, mtime) signature.
+
+    Args:
+        a: Stat result of the first file.
+        b: Stat result of the second file.
+
+    Returns:
+        True if size and modification time match, like ``filecmp.cmp(shallow=True)``.
+    """
+    return a.st_size == b.st_size and a.st_mtime_ns == b.st_mtime_ns
+
+
+def _needs_copy(src: str | Path, dst: str | Path) -> bool:
+    """Check whether a forced restore has to copy a backup file over its target.
+
+    Restored files keep the backup's modification time, so a regular file with
+    the same (size, mtime) signature as its backup file is left as it is.
+
+    Args:
+        src: File in the backup.
+        dst: Target path.
+
+    Returns:
+        False if the target already matches the backup file, True otherwise.
+    """
+    try:
+        dst_stat = os.lstat(dst)
+        if not stat.S_ISREG(dst_stat.st_mode):
+            return True
+        return not _shallow_equal(os.stat(src), dst_stat)
+    except OSError:
+        return True
+
+
+def _same_content(a: Path, b: Path, size: int) -> bool:
+    """Compare two files of equal size byte for byte, without stat calls.
+
+    Small files are read whole; larger ones are mapped and compared slice by
+    slice straight from the page cache, without read() calls.
+
+    Args:
+        a: First file.
+        b: Second file.
+        size: Size of both files, as already known from a stat or scan.
+
+    Returns:
+        True if both files have identical contents.
+    """
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        if size < _MMAP_THRESHOLD:
+            return fa.read() == fb.read()
+        try:
+            with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, mmap.mmap(
+                fb.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mb:
+                # mmap objects compare by identity, so compare slices; each
+                # bytes comparison is a memcmp
+                return len(ma) == len(mb) and all(
+                    ma[i : i + _COPY_CHUNK_SIZE] == mb[i : i + _COPY_CHUNK_SIZE]
+                    for i in range(0, len(ma), _COPY_CHUNK_SIZE)
+                )
+        except (OSError, ValueError):
+            # Not mappable (e.g. special files or a file truncated meanwhile)
+            pass
+        while True:
+            chunk_a = fa.read(_COPY_CHUNK_SIZE)
+            if chunk_a != fb.read(_COPY_CHUNK_SIZE):
+                return False
+            if not chunk_a:
+                return True
+
+
+def _hash_file(path: Path) -> bytes:
+    """Return the BLAKE2b digest of a file's contents."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, hashlib.blake2b).digest()
+        digest = hashlib.blake2b()
+        while True:
+            chunk = f.read(_COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.digest()
+
+
+class ValidationEvent(NamedTuple):
+    """Outcome of validating one restored path."""
+
+    program: str
+    # "started" (path is None), "success" or "failed"
+    status: str
+    path: Optional[Path]
+    reason: Optional[str]
+
+
+class RestoreOutcome(NamedTuple):
+    """Result of restoring one program."""
+
+    success: bool
+    # Existing targets were left alone because force was not given
+    skipped: bool
+
+
+@dataclass(frozen=True)
+class _ProgramSpec:
+    """Restore patterns of a program, normalized once from the config."""
+
+    files: Tuple[str, ...]
+    directories: Tuple[str, ...]
+    # First path component of every pattern (None when it cannot be determined)
+    tops: FrozenSet[Optional[str]]
+    # Path components of every pattern
+    parts: Dict[str, Tuple[str, ...]]
 
 
 class RestoreManager:
@@ -44,11 +469,60 @@ class RestoreManager:
         self.console = Console()
         self.backup_dir = Path(self.config.get("backup_dir", "backups"))
         self.logger = logging.getLogger(__name__)
+        # (cwd, backup_dir) from the last _update_backup_dir resolution
+        self._resolved_backup_dir: Optional[Tuple[Path, Path]] = None
+        # Sorted (name, path) backup listings keyed by (repo_dir, branch), kept
+        # only while restore() runs
+        self._backup_listings: Optional[Dict[Tuple[Path, Optional[str]], List[Tuple[str, str]]]] = (
+            None
+        )
+        # Per-program path plans, keyed by (program, program_dir, target_dir)
+        self._plan_cache: Dict[Tuple[str, Path, Path], _RestorePlan] = {}
+        # File digests keyed by path, with the (size, mtime_ns) they were taken at
+        self._hash_cache: Dict[str, Tuple[int, int, bytes]] = {}
+        # Stat results of backup paths, kept only while restore() runs
+        self._backup_stats: Optional[Dict[Path, Tuple[Optional[str], Optional[os.stat_result]]]] = (
+            None
+        )
+        # Normalized program patterns and the config version they were built from
+        self._index: Dict[str, _ProgramSpec] = {}
+        self._index_version: Optional[int] = None
+        # Whether the running restore hardlinks files instead of copying them
+        self._hardlink = False
         self.logger.debug("RestoreManager initialized with backup directory: %s", self.backup_dir)
 
+    @property
+    def _program_index(self) -> Dict[str, _ProgramSpec]:
+        """Normalized patterns for every configured program.
+
+        Programs without a configuration are left out. The index, and the plans
+        built from it, are rebuilt after the config is reloaded.
+        """
+        if self._index_version == self.config.version:
+            return self._index
+        index: Dict[str, _ProgramSpec] = {}
+        for program, program_config in self.config.programs.items():
+            if not program_config:
+                continue
+            entries = self.config.program_entries(program)
+            files = tuple(pattern for pattern, is_dir, _ in entries if not is_dir)
+            directories = tuple(pattern for pattern, is_dir, _ in entries if is_dir)
+            index[program] = _ProgramSpec(
+                files=files,
+                directories=directories,
+                tops=frozenset(_top_component(pattern) for pattern in files + directories),
+                parts={pattern: Path(pattern).parts for pattern in files + directories},
+            )
+        self._plan_cache.clear()
+        self._index = index
+        self._index_version = self.config.version
+        return index
+
     def _update_backup_dir(self) -> None:
         """Update backup directory path based on current working directory."""
         cwd = Path.cwd()
+        if self._resolved_backup_dir == (cwd, self.backup_dir):
+            return
         self.logger.debug("Initial backup_dir: %s", self.backup_dir)
         self.logger.debug("Current working directory: %s", cwd)
 
@@ -60,8 +534,68 @@ class RestoreManager:
             # Otherwise, use the backup directory from the config
             self.backup_dir = Path(self.config.get("backup_dir", "backups"))
 
-        self.logger.debug("Final backup directory: %s", self.backup_dir)
-        self.logger.debug("Checking if backup directory exists: %s", self.backup_dir.exists())
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Final backup directory: %s", self.backup_dir)
+            self.logger.debug("Checking if backup directory exists: %s", self.backup_dir.exists())
+        self._resolved_backup_dir = (cwd, self.backup_dir)
+
+    def reset_cache(self) -> None:
+        """Forget the cached backup location, plans and digests.
+
+        Needed when the configuration changes during the lifetime of a manager,
+        e.g. between steps of a test.
+        """
+        self._resolved_backup_dir = None
+        self._plan_cache.clear()
+        self._hash_cache.clear()
+        self._index_version = None
+
+    def _list_backups(self, repo_dir: Path, branch: Optional[str]) -> List[Tuple[str, str]]:
+        """List the backups of a repository, oldest first.
+
+        Within one restore() call a listing is made once and then reused, so
+        repeated lookups skip the directory walk.
+
+        Args:
+            repo_dir: Backup directory of the repository.
+            branch: Branch to list, or None for all branches.
+
+        Returns:
+            List of (name, path) pairs sorted by name, so the newest is last.
+        """
+        key = (repo_dir, branch)
+        cache = self._backup_listings
+        if cache is not None and key in cache:
+            return cache[key]
+
+        backups: List[Tuple[str, str]] = []
+        if branch:
+            with os.scandir(repo_dir / branch) as entries:
+                backups = [(entry.name, entry.path) for entry in entries]
+            logger.debug("Found %d backups in branch directory", len(backups))
+        else:
+            # Otherwise look in all branch directories
+            logger.debug("No branch specified, looking in all branch directories")
+            with os.scandir(repo_dir) as branch_entries:
+                # DirEntry.is_dir() answers from the directory listing; only
+                # symlinked branch directories need a stat to follow the link
+                branch_dirs = [entry.path for entry in branch_entries if entry.is_dir()]
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for branch_dir in branch_dirs:
+                with os.scandir(branch_dir) as entries:
+                    branch_backups = [(entry.name, entry.path) for entry in entries]
+                if debug:
+                    logger.debug(
+                        "Found %d backups in branch directory %s", len(branch_backups), branch_dir
+                    )
+                backups.extend(branch_backups)
+
+        # Timestamped names sort chronologically, so sort the (name, path) tuples
+        # directly; equal names fall back to the path
+        backups.sort()
+        if cache is not None:
+            cache[key] = backups
+        return backups
 
     def find_backup(
         self,
@@ -85,127 +619,201 @@ class RestoreManager:
 
         repo_dir = self.backup_dir / repo_name
         logger.debug("Repository directory: %s", repo_dir)
-        logger.debug("Checking if repository directory exists: %s", repo_dir.exists())
+        repo_exists = repo_dir.exists()
+        logger.debug("Checking if repository directory exists: %s", repo_exists)
 
-        if not repo_dir.exists():
+        if not repo_exists:
             logger.warning("No backups found for repository '%s'", repo_name)
             self.console.print(f"[yellow]No backups found for repository '{repo_name}'[/yellow]")
             return None
 
-        # Get all backups for the repository
-        backups = []
-
-        # If branch specified, look in that branch directory
+        # If branch specified, make sure that branch directory exists
         if branch:
             branch_dir = repo_dir / branch
             logger.debug("Branch directory: %s", branch_dir)
-            logger.debug("Checking if branch directory exists: %s", branch_dir.exists())
+            branch_exists = branch_dir.exists()
+            logger.debug("Checking if branch directory exists: %s", branch_exists)
 
-            if not branch_dir.exists():
+            if not branch_exists:
                 logger.warning("Branch directory %s does not exist", branch_dir)
                 self.console.print(f"[yellow]No backups found for branch '{branch}'[/yellow]")
                 return None
-            backups = list(branch_dir.iterdir())
-            logger.debug("Found %d backups in branch directory", len(backups))
-        else:
-            # Otherwise look in all branch directories
-            logger.debug("No branch specified, looking in all branch directories")
-            for branch_dir in repo_dir.iterdir():
-                if branch_dir.is_dir():
-                    logger.debug("Found branch directory: %s", branch_dir)
-                    branch_backups = list(branch_dir.iterdir())
-                    logger.debug(
-                        "Found %d backups in branch directory %s", len(branch_backups), branch_dir
-                    )
-                    backups.extend(branch_backups)
+
+        # Get all backups as (name, path) pairs; only the chosen backup becomes a Path
+        backups = self._list_backups(repo_dir, branch)
 
         if not backups:
             logger.warning("No backups found for repository '%s'", repo_name)
             self.console.print(f"[yellow]No backups found for repository '{repo_name}'[/yellow]")
             return None
 
-        # Sort backups by timestamp (newest first)
-        backups.sort(key=lambda p: p.name, reverse=True)
         logger.debug("Found %d backups for repository '%s'", len(backups), repo_name)
-        logger.debug("Backup paths: %s", [str(b) for b in backups])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Backup paths: %s", [path for _, path in backups])
 
         # If latest flag is set, return the latest backup
         if latest:
-            logger.debug("Using latest backup: %s", backups[0])
-            return backups[0]
+            logger.debug("Using latest backup: %s", backups[-1][1])
+            return Path(backups[-1][1])
 
         # If date is specified, find the matching backup
         if date:
-            # Handle both full timestamp and date-only formats
-            matching_backups = []
-            for backup in backups:
-                if date == backup.name:  # Exact match
-                    logger.debug("Found exact date match: %s", backup)
-                    return backup
-                elif len(date) == 8 and backup.name.startswith(date):  # Date-only match
-                    matching_backups.append(backup)
-
-            if matching_backups:
-                # Return the latest backup for the specified date
-                latest_matching = max(matching_backups, key=lambda x: x.name)
+            # Handle both full timestamp and date-only formats. The listing is
+            # sorted, so the names equal to or starting with the date form a
+            # contiguous range; the last entry of a range is the latest backup.
+            start = bisect.bisect_left(backups, (date,))
+            end = bisect.bisect_left(backups, (date + "\0",), start)
+            if end > start:  # Exact match
+                logger.debug("Found exact date match: %s", backups[end - 1][1])
+                return Path(backups[end - 1][1])
+
+            latest_matching: Optional[str] = None
+            if len(date) == 8:  # Date-only match
+                end = bisect.bisect_left(backups, (date + "\U0010ffff",), start)
+                if end > start:
+                    latest_matching = backups[end - 1][1]
+
+            if latest_matching is not None:
                 logger.debug("Found date match: %s", latest_matching)
-                return latest_matching
+                return Path(latest_matching)
             else:
                 logger.warning("No backups found for date '%s'", date)
                 self.console.print(f"[yellow]No backups found for date '{date}'[/yellow]")
                 return None
 
         # Return latest backup if no date specified
-        logger.debug("Using latest backup (default): %s", backups[0])
-        return backups[0]
+        logger.debug("Using latest backup (default): %s", backups[-1][1])
+        return Path(backups[-1][1])
+
+    def _same_entry(self, target: Path, backup: Path) -> bool:
+        """Check whether a target path already matches its backup.
+
+        Files are compared by size, then by digest; digests are cached per path
+        and (size, mtime) so unchanged files are hashed only once.
+
+        Args:
+            target: Existing path in the target directory.
+            backup: Corresponding path in the backup.
+
+        Returns:
+            True if both are files with equal contents or directories with
+            matching trees.
+        """
+        target_kind, target_stat = _kind(target)
+        backup_kind, backup_stat = self._backup_kind(backup)
+        if target_kind != backup_kind:
+            return False
+        if target_kind == "dir":
+            return _dirdiff(backup, target) is None
+        if target_kind != "file" or target_stat.st_size != backup_stat.st_size:
+            return False
+        return self._digest(target, target_stat) == self._digest(backup, backup_stat)
+
+    def _digest(self, path: Path, st: os.stat_result) -> bytes:
+        """Get the digest of a file, reusing it while the file is unchanged.
+
+        Args:
+            path: File to hash.
+            st: Current stat result of the file.
+
+        Returns:
+            BLAKE2b digest of the file's contents.
+        """
+        key = os.fspath(path)
+        cached = self._hash_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+            return cached[2]
+        digest = _hash_file(path)
+        self._hash_cache[key] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def iter_program_paths(self, repo: GitRepository, program: str) -> Iterator[Path]:
+        """Yield the paths that would be restored for a program.
+
+        Args:
+            repo: Repository being restored into.
+            program: Program to get paths for.
+
+        Yields:
+            Target path of every configured file, then of every directory.
+        """
+        spec = self._program_index.get(program)
+        if spec is None:
+            return
+        for pattern in spec.files + spec.directories:
+            yield repo.path / pattern
 
     def get_program_paths(self, repo: GitRepository, program: str) -> Set[Path]:
         """Get all paths that would be restored for a program."""
-        paths: Set[Path] = set()
-        program_config = self.config.get_program_config(program)
-        if not program_config:
-            return paths
+        return set(self.iter_program_paths(repo, program))
+
+    def check_conflicts(
+        self,
+        repo: GitRepository,
+        backup_path: Path,
+        ignore_identical: bool = False,
+        programs: Optional[List[str]] = None,
+    ) -> Set[Tuple[Path, Path]]:
+        """Check for conflicts between backup and target directory.
 
-        # Get paths to restore
-        files = program_config.get("files", [])
-        directories = program_config.get("directories", [])
+        Args:
+            repo: Repository being restored into.
+            backup_path: Backup directory to restore from.
+            ignore_identical: Leave out targets whose contents already match the
+                backup, so only paths a restore would change are reported.
+            programs: Programs to check, all configured programs if not given.
 
-        # Add file paths
-        for file_pattern in files:
-            file_path = repo.path / file_pattern
-            paths.add(file_path)
+        Returns:
+            Set of (target path, backup path) pairs that exist on both sides.
+        """
+        conflicts: Set[Tuple[Path, Path]] = set()
 
-        # Add directory paths
-        for dir_pattern in directories:
-            dir_path = repo.path / dir_pattern
-            paths.add(dir_path)
+        # One listing of the target lets programs with nothing there be skipped
+        try:
+            entries = set(os.listdir(repo.path))
+        except (FileNotFoundError, NotADirectoryError):
+            return conflicts
+        if not entries:
+            return conflicts
+        try:
+            with os.scandir(backup_path) as it:
+                backup_programs = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return conflicts
 
-        return paths
+        for program in self.config.programs if programs is None else programs:
+            if program not in backup_programs:
+                continue
 
-    def check_conflicts(self, repo: GitRepository, backup_path: Path) -> Set[Tuple[Path, Path]]:
-        """Check for conflicts between backup and target directory."""
-        conflicts = set()
+            spec = self._program_index.get(program)
+            if spec is None:
+                continue
 
-        for program in self.config.programs:
-            program_config = self.config.get_program_config(program)
-            if not program_config:
+            if None not in spec.tops and not spec.tops & entries:
                 continue
 
             program_backup = backup_path / program
-            if not program_backup.exists():
+            try:
+                with os.scandir(program_backup) as it:
+                    backup_names = {entry.name for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            # Get all paths that would be restored
-            target_paths = self.get_program_paths(repo, program)
+            # Reuse the restore plan so conflicts are checked against exactly
+            # the paths restore_program would write
+            file_plan, dir_plan = self._plan(program, program_backup, repo.path)
 
-            # Check each target path for conflicts
-            for target_path in target_paths:
-                if target_path.exists():
-                    # Get the corresponding backup path
-                    rel_path = target_path.relative_to(repo.path)
-                    backup_file = program_backup / rel_path
-                    if backup_file.exists():
-                        conflicts.add((target_path, backup_file))
+            # Check each target path for conflicts; top-level names are answered
+            # from the listings, only nested paths need a stat on each side
+            for pattern, backup_file, target_path in file_plan + dir_plan:
+                parts = spec.parts[pattern]
+                if parts and (parts[0] not in entries or parts[0] not in backup_names):
+                    continue
+                if len(parts) != 1 and not (target_path.exists() and backup_file.exists()):
+                    continue
+                if ignore_identical and self._same_entry(target_path, backup_file):
+                    continue
+                conflicts.add((target_path, backup_file))
 
         return conflicts
 
@@ -215,6 +823,9 @@ class RestoreManager:
         target_path: Path,
         force: bool = False,
         dry_run: bool = False,
+        made_dirs: Optional[Set[Path]] = None,
+        skipped: Optional[Set[Path]] = None,
+        messages: Optional[List[str]] = None,
     ) -> bool:
         """Restore a single file.
 
@@ -223,37 +834,87 @@ class RestoreManager:
             target_path: Target path to restore to.
             force: Whether to force restore over existing files.
             dry_run: Whether to perform a dry run.
+            made_dirs: Directories already created during this restore.
+            skipped: Collects targets left alone because they already exist.
+            messages: Collects status lines to print later instead of printing
+                them one by one.
 
         Returns:
             True if restore was successful, False otherwise.
         """
+        say = self.console.print if messages is None else messages.append
         if dry_run:
             logger.debug("Would restore file: %s -> %s", src_file, target_path)
-            self.console.print(f"Would restore file: {src_file} -> {target_path}")
+            say(f"Would restore file: {src_file} -> {target_path}")
+            return True
+
+        if force and not _needs_copy(src_file, target_path):
+            logger.debug("File is unchanged, not copying: %s", target_path)
             return True
 
         try:
-            if target_path.exists():
-                if not force:
-                    logger.debug(
-                        "Skipping existing file: %s (use --force to overwrite)", target_path
-                    )
-                    self.console.print(
-                        f"[yellow]Skipping existing file: {target_path} (use --force to overwrite)[/yellow]"
-                    )
-                    return False
-                else:
-                    # If force is True, remove the existing file
-                    target_path.unlink()
+            if force:
+                # Remove any existing file without checking for it first
+                target_path.unlink(missing_ok=True)
 
             # Create parent directories if they don't exist
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(target_path.parent, made_dirs)
+        except Exception as e:
+            logger.error("Error restoring file %s: %s", target_path, e)
+            self.console.print(f"[red]Error restoring file {target_path}: {e}[/red]")
+            return False
+
+        if force:
+            return self._copy_file(src_file, target_path)
+        try:
+            # Without force the target is created exclusively, which checks for
+            # an existing file in the same open
+            return self._copy_file(src_file, target_path, exclusive=True)
+        except FileExistsError:
+            logger.debug("Skipping existing file: %s (use --force to overwrite)", target_path)
+            say(
+                f"[yellow]Skipping existing file: {target_path} (use --force to overwrite)[/yellow]"
+            )
+            if skipped is not None:
+                skipped.add(target_path)
+            return False
+
+    def _copy_file(
+        self, src_file: str | Path, target_path: str | Path, exclusive: bool = False
+    ) -> bool:
+        """Copy a file whose target directory exists.
+
+        Safe to call from several threads at once.
+
+        Args:
+            src_file: Source file to restore from.
+            target_path: Target path to restore to.
+            exclusive: Raise FileExistsError if the target exists instead of
+                replacing it.
 
+        Returns:
+            True if the copy was successful, False otherwise.
+        """
+        if self._hardlink:
+            try:
+                os.link(src_file, target_path)
+                logger.info("Successfully linked file: %s", target_path)
+                return True
+            except FileExistsError:
+                if exclusive:
+                    raise
+            except OSError as e:
+                # Other filesystem, or one without hardlinks: copy instead
+                logger.debug("Could not link %s, copying instead: %s", target_path, e)
+
+        try:
             # Copy the file with metadata
-            shutil.copy2(src_file, target_path)
+            _copy(src_file, target_path, exclusive)
             logger.info("Successfully restored file: %s", target_path)
             return True
         except Exception as e:
+            if exclusive and isinstance(e, FileExistsError):
+                raise
             logger.error("Error restoring file %s: %s", target_path, e)
             self.console.print(f"[red]Error restoring file {target_path}: {e}[/red]")
             return False
@@ -264,7 +925,10 @@ class RestoreManager:
         dst_dir: Path,
         force: bool = False,
         dry_run: bool = False,
-        restored_files: Optional[Set[Path]] = None,
+        restored_files: Optional[Set[str]] = None,
+        made_dirs: Optional[Set[Path]] = None,
+        skipped: Optional[Set[Path]] = None,
+        messages: Optional[List[str]] = None,
     ) -> bool:
         """Restore a directory and its contents.
 
@@ -273,38 +937,86 @@ class RestoreManager:
             dst_dir: Target directory to restore to.
             force: Whether to force restore files.
             dry_run: Whether to perform a dry run.
-            restored_files: Set of already restored files to avoid duplicates.
+            restored_files: Paths of already restored files, to avoid duplicates.
+            made_dirs: Directories already created during this restore.
+            skipped: Collects targets left alone because they already exist.
+            messages: Collects status lines to print later instead of printing
+                them one by one.
 
         Returns:
             True if successful, False otherwise.
         """
+        say = self.console.print if messages is None else messages.append
         if dry_run:
             logger.debug("Would restore directory: %s -> %s", src_dir, dst_dir)
-            self.console.print(f"Would restore directory: {src_dir} -> {dst_dir}")
+            say(f"Would restore directory: {src_dir} -> {dst_dir}")
             return True
 
         try:
             # Create target directory if it doesn't exist
-            dst_dir.mkdir(parents=True, exist_ok=True)
-
-            # Restore files in the directory recursively
-            for src_path in src_dir.rglob("*"):
-                if src_path.is_file():
-                    # Get the relative path from the source directory
-                    rel_path = src_path.relative_to(src_dir)
-                    # Create the target path with the same directory structure
-                    dst_path = dst_dir / rel_path
-                    # Skip if we've already restored this file
-                    if restored_files is not None and dst_path in restored_files:
+            if made_dirs is None:
+                made_dirs = set()
+            _ensure_dir(dst_dir, made_dirs)
+
+            # Collect the files in the directory recursively. Paths stay strings
+            # in this loop; building a Path per file costs more than the join.
+            dst_root = os.fspath(dst_dir)
+            debug = logger.isEnabledFor(logging.DEBUG)
+            pairs: List[Tuple[str, str]] = []
+            for src_path, rel_path in _iter_files(os.fspath(src_dir)):
+                # Create the target path with the same directory structure
+                dst_path = os.path.join(dst_root, rel_path)
+                # Skip if we've already restored this file
+                if restored_files is not None and dst_path in restored_files:
+                    if debug:
                         logger.debug("Skipping already restored file: %s", dst_path)
-                        continue
-                    # Create parent directories if they don't exist
-                    dst_path.parent.mkdir(parents=True, exist_ok=True)
-                    # Restore the file
-                    if not self._restore_file(src_path, dst_path, force, dry_run):
-                        return False
-                    if restored_files is not None:
+                    continue
+                pairs.append((src_path, dst_path))
+
+            # Files are restored in order up to the first existing target, which
+            # is skipped and ends the restore of this directory. With force, targets
+            # that already match their backup file are left alone.
+            blocked: Optional[str] = None
+            if force:
+                changed: List[Tuple[str, str]] = []
+                for src_path, dst_path in pairs:
+                    if _needs_copy(src_path, dst_path):
+                        changed.append((src_path, dst_path))
+                    elif restored_files is not None:
                         restored_files.add(dst_path)
+                pairs = changed
+            for index, (_, dst_path) in enumerate(pairs):
+                if force:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(dst_path)
+                elif os.path.exists(dst_path):
+                    blocked = dst_path
+                    pairs = pairs[:index]
+                    break
+
+            # Create parent directories up front so the copies can run concurrently
+            for parent in dict.fromkeys(os.path.dirname(dst_path) for _, dst_path in pairs):
+                _ensure_dir(Path(parent), made_dirs)
+
+            workers = min(_RESTORE_WORKERS, len(pairs))
+            if workers <= 1:
+                results = [self._copy_file(src_path, dst_path) for src_path, dst_path in pairs]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(lambda pair: self._copy_file(*pair), pairs))
+
+            if restored_files is not None:
+                restored_files.update(dst_path for (_, dst_path), ok in zip(pairs, results) if ok)
+            if not all(results):
+                return False
+            if blocked is not None:
+                logger.debug("Skipping existing file: %s (use --force to overwrite)", blocked)
+                say(
+                    f"[yellow]Skipping existing file: {blocked} (use --force to overwrite)[/yellow]"
+                )
+                if skipped is not None:
+                    skipped.add(Path(blocked))
+                return False
 
             logger.info("Successfully restored directory: %s", dst_dir)
             return True
@@ -313,6 +1025,58 @@ class RestoreManager:
             self.console.print(f"[red]Error restoring directory {dst_dir}: {e}")
             return False
 
+    def _backup_kind(self, path: Path) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        """Stat a path inside a backup, reusing results within one restore.
+
+        Backups are not modified while they are restored, so restore() keeps the
+        results for the duration of the call; the restore and validation passes
+        then stat each backup path only once.
+
+        Args:
+            path: Path inside the backup.
+
+        Returns:
+            Same as _kind.
+        """
+        cache = self._backup_stats
+        if cache is None:
+            return _kind(path)
+        result = cache.get(path)
+        if result is None:
+            result = cache[path] = _kind(path)
+        return result
+
+    def _plan(self, program: str, program_dir: Path, target_dir: Path) -> _RestorePlan:
+        """Get the backup and target paths for a program's configured entries.
+
+        The plan is built once per (program, program_dir, target_dir) and shared
+        by check_conflicts, restore_program and validate_restore.
+
+        Args:
+            program: Program name.
+            program_dir: Program directory inside the backup.
+            target_dir: Directory being restored into.
+
+        Returns:
+            Tuple of (files, directories) plan entries.
+        """
+        # Looking up the index first drops plans made from an older config
+        spec = self._program_index.get(program)
+        key = (program, program_dir, target_dir)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            files = spec.files if spec else ()
+            directories = spec.directories if spec else ()
+            plan = (
+                tuple((pattern, program_dir / pattern, target_dir / pattern) for pattern in files),
+                tuple(
+                    (pattern, program_dir / pattern, target_dir / pattern)
+                    for pattern in directories
+                ),
+            )
+            self._plan_cache[key] = plan
+        return plan
+
     def restore_program(
         self,
         program: str,
@@ -320,7 +1084,7 @@ class RestoreManager:
         target_dir: Path,
         force: bool = False,
         dry_run: bool = False,
-    ) -> bool:
+    ) -> RestoreOutcome:
         """Restore program configurations.
 
         Args:
@@ -331,202 +1095,321 @@ class RestoreManager:
             dry_run: Whether to perform a dry run.
 
         Returns:
-            True if successful, False otherwise.
+            Whether the restore succeeded and whether existing files were skipped.
         """
         success = True
-        restored_files = set()
-        program_config = self.config.get_program_config(program)
-
-        if program_config:
-            # First restore files
-            for file_pattern in program_config.get("files", []):
-                # Get the source file path from the backup
-                src_file = program_source / program / file_pattern
-                # Create the target file path preserving the directory structure
-                dst_file = target_dir / file_pattern
-
-                if src_file.exists():
-                    # Create parent directories if they don't exist
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                    if not self._restore_file(src_file, dst_file, force, dry_run):
-                        success = False
-                    else:
-                        restored_files.add(dst_file)
-                        self.console.print(
-                            f"[green]Restored: {program}/{file_pattern} -> {file_pattern}"
-                        )
+        restored_files: Set[str] = set()
+        made_dirs: Set[Path] = set()
+        skipped: Set[Path] = set()
+        # Progress lines are printed together once the program is done
+        messages: List[str] = []
+
+        if program in self._program_index:
+            file_plan, dir_plan = self._plan(program, program_source / program, target_dir)
+
+            # First restore files. They are independent, so they are copied
+            # concurrently; each keeps its own messages so output stays in order.
+            file_jobs: List[Tuple[str, Path, Path, List[str]]] = [
+                (file_pattern, src_file, dst_file, [])
+                for file_pattern, src_file, dst_file in file_plan
+                if self._backup_kind(src_file)[0] == "file"
+            ]
+            if not dry_run:
+                # Create parents up front so workers never race on mkdir; errors
+                # are reported by _restore_file when it retries
+                for _, _, dst_file, _ in file_jobs:
+                    with contextlib.suppress(OSError):
+                        _ensure_dir(dst_file.parent, made_dirs)
+
+            def restore_job(job: Tuple[str, Path, Path, List[str]]) -> bool:
+                _, src_file, dst_file, job_messages = job
+                return self._restore_file(
+                    src_file, dst_file, force, dry_run, made_dirs, skipped, job_messages
+                )
+
+            workers = 1 if dry_run else min(_RESTORE_WORKERS, len(file_jobs))
+            if workers <= 1:
+                results = [restore_job(job) for job in file_jobs]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(restore_job, file_jobs))
+
+            for (file_pattern, _, dst_file, job_messages), ok in zip(file_jobs, results):
+                messages.extend(job_messages)
+                if not ok:
+                    success = False
+                else:
+                    restored_files.add(os.fspath(dst_file))
+                    messages.append(
+                        f"[green]Restored: {program}/{file_pattern} -> {file_pattern}[/green]"
+                    )
 
             # Then restore directories
-            for dir_pattern in program_config.get("directories", []):
-                # Get the source directory path from the backup
-                src_dir = program_source / program / dir_pattern
-                # Create the target directory path preserving the directory structure
-                dst_dir = target_dir / dir_pattern
-
-                if src_dir.exists():
-                    # Create parent directories if they don't exist
-                    dst_dir.parent.mkdir(parents=True, exist_ok=True)
+            for dir_pattern, src_dir, dst_dir in dir_plan:
+                if self._backup_kind(src_dir)[0] == "dir":
                     if not self._restore_directory(
-                        src_dir, dst_dir, force, dry_run, restored_files
+                        src_dir,
+                        dst_dir,
+                        force,
+                        dry_run,
+                        restored_files,
+                        made_dirs,
+                        skipped,
+                        messages,
                     ):
                         success = False
                     else:
-                        self.console.print(
-                            f"[green]Restored directory: {program}/{dir_pattern} -> {dir_pattern}"
+                        messages.append(
+                            f"[green]Restored directory: {program}/{dir_pattern} -> {dir_pattern}[/green]"
                         )
 
         if success:
-            self.console.print(f"[green]Successfully restored program '{program}'")
+            messages.append(f"[green]Successfully restored program '{program}'")
         else:
-            self.console.print(f"[red]Failed to restore program '{program}'")
+            messages.append(f"[red]Failed to restore program '{program}'")
+        self.console.print("\n".join(messages))
 
-        return success
+        return RestoreOutcome(success, bool(skipped))
 
     def validate_restore(
         self,
         backup_path: Path,
         target_dir: Path,
         programs: List[str],
+        force_full: bool = False,
     ) -> Tuple[bool, Dict[str, Dict[str, List[Tuple[Path, Optional[str]]]]]]:
-        """Validate that files were restored correctly."""
+        """Validate that files were restored correctly.
+
+        Files are compared by size, then by contents. Files inside restored
+        directories are compared by (size, mtime) signature unless force_full is given.
+
+        Args:
+            backup_path: Backup directory that was restored from.
+            target_dir: Directory that was restored into.
+            programs: Programs to validate.
+            force_full: Also compare the contents of files inside restored directories.
+
+        Returns:
+            Tuple of (all valid, per-program success/failed results).
+        """
         logger.info("Validating restore from %s to %s", backup_path, target_dir)
         validation_results: Dict[str, Dict[str, List[Tuple[Path, Optional[str]]]]] = {}
         all_valid = True
 
-        for program in programs:
-            program_config = self.config.get_program_config(program)
-            if not program_config:
-                logger.warning("No configuration found for program '%s'", program)
+        for event in self.iter_validation_events(backup_path, target_dir, programs, force_full):
+            program_results = validation_results.setdefault(
+                event.program, {"success": [], "failed": []}
+            )
+            if event.status == "started":
+                continue
+            program_results[event.status].append((event.path, event.reason))
+            if event.status == "failed":
+                all_valid = False
+
+        if all_valid:
+            logger.info("All files validated successfully")
+        else:
+            logger.warning("Some files failed validation")
+
+        return all_valid, validation_results
+
+    def iter_validation_events(
+        self,
+        backup_path: Path,
+        target_dir: Path,
+        programs: List[str],
+        force_full: bool = False,
+    ) -> Iterator[ValidationEvent]:
+        """Validate restored files, yielding each result as it is known.
+
+        Args:
+            backup_path: Backup directory that was restored from.
+            target_dir: Directory that was restored into.
+            programs: Programs to validate.
+            force_full: Also compare the contents of files inside restored directories.
+
+        Yields:
+            A "started" event for every program that is validated, followed by a
+            "success" or "failed" event for each of its files and directories.
+        """
+        # Programs are independent, so validate them concurrently; events are
+        # yielded in the order the programs were given
+        workers = min(_VALIDATE_WORKERS, len(programs))
+        if workers <= 1:
+            for program in programs:
+                yield from self._iter_program_events(program, backup_path, target_dir, force_full)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for events in executor.map(
+                lambda program: list(
+                    self._iter_program_events(program, backup_path, target_dir, force_full)
+                ),
+                programs,
+            ):
+                yield from events
+
+    def _iter_program_events(
+        self,
+        program: str,
+        backup_path: Path,
+        target_dir: Path,
+        force_full: bool = False,
+    ) -> Iterator[ValidationEvent]:
+        """Validate the restored files of a single program.
+
+        Args:
+            program: Program to validate.
+            backup_path: Backup directory that was restored from.
+            target_dir: Directory that was restored into.
+            force_full: Also compare the contents of files inside restored directories.
+
+        Yields:
+            Validation events; nothing if the program has no configuration or no
+            backup.
+        """
+        if program not in self._program_index:
+            logger.warning("No configuration found for program '%s'", program)
+            return
+
+        program_dir = backup_path / program
+        if self._backup_kind(program_dir)[0] is None:
+            logger.warning("Program directory '%s' not found in backup", program_dir)
+            return
+
+        yield ValidationEvent(program, "started", None, None)
+        logger.info("Validating program '%s'", program)
+        file_plan, dir_plan = self._plan(program, program_dir, target_dir)
+
+        # Validate files
+        for _, src_path, dst_path in file_plan:
+            src_kind, src_stat = self._backup_kind(src_path)
+            dst_kind, dst_stat = _kind(dst_path)
+
+            # Check if the file exists in the backup
+            if src_kind != "file":
+                # If the file doesn't exist in the backup but exists in the target,
+                # it's not a validation error (it wasn't restored)
+                if dst_kind is not None:
+                    # This is a file that was manually created or not removed during restore
+                    logger.warning("File exists in target but not in backup: %s", dst_path)
                 continue
 
-            program_dir = backup_path / program
-            if not program_dir.exists():
-                logger.warning("Program directory '%s' not found in backup", program_dir)
+            # Now check if the file exists in the target
+            if dst_kind is None:
+                logger.error("File does not exist in target: %s", dst_path)
+                yield ValidationEvent(program, "failed", dst_path, "File does not exist in target")
                 continue
 
-            validation_results[program] = {"success": [], "failed": []}
-            logger.info("Validating program '%s'", program)
-
-            # Validate files
-            for file_pattern in program_config.get("files", []):
-                # Use the full path for both source and destination
-                src_path = program_dir / file_pattern
-                dst_path = target_dir / file_pattern
-
-                # Check if the file exists in the backup
-                if not src_path.exists() or not src_path.is_file():
-                    # If the file doesn't exist in the backup but exists in the target,
-                    # it's not a validation error (it wasn't restored)
-                    if dst_path.exists():
-                        # This is a file that was manually created or not removed during restore
-                        logger.warning("File exists in target but not in backup: %s", dst_path)
+            # Compare file contents
+            if src_stat.st_size != dst_stat.st_size:
+                # Files of different sizes cannot match; no need to read them
+                yield self._file_event(program, dst_path, False, src_stat.st_size, dst_stat.st_size)
+            else:
+                try:
+                    matches = _same_content(src_path, dst_path, src_stat.st_size)
+                except OSError:
+                    logger.error("Could not compare file: %s", dst_path)
+                    yield ValidationEvent(program, "failed", dst_path, "Could not compare file")
                     continue
+                yield self._file_event(
+                    program, dst_path, matches, src_stat.st_size, dst_stat.st_size
+                )
 
-                # Now check if the file exists in the target
-                if not dst_path.exists():
-                    all_valid = False
-                    logger.error("File does not exist in target: %s", dst_path)
-                    validation_results[program]["failed"].append(
-                        (dst_path, "File does not exist in target")
-                    )
-                    continue
+        # Validate directories
+        for _, src_path, dst_path in dir_plan:
+            dst_kind = _kind(dst_path)[0]
+
+            # Check if the directory exists in the backup
+            if self._backup_kind(src_path)[0] != "dir":
+                # If the directory doesn't exist in the backup but exists in the target,
+                # it's not a validation error (it wasn't restored)
+                if dst_kind is not None:
+                    # This is a directory that was manually created or not removed during restore
+                    logger.warning("Directory exists in target but not in backup: %s", dst_path)
+                continue
 
-                # Compare file contents
-                if filecmp.cmp(src_path, dst_path, shallow=False):
-                    logger.info("File validated successfully: %s", dst_path)
-                    validation_results[program]["success"].append((dst_path, None))
-                else:
-                    all_valid = False
-                    # Get file sizes for additional info
-                    src_size = src_path.stat().st_size
-                    dst_size = dst_path.stat().st_size
+            # Now check if the directory exists in the target
+            if dst_kind is None:
+                logger.error("Directory does not exist in target: %s", dst_path)
+                yield ValidationEvent(
+                    program, "failed", dst_path, "Directory does not exist in target"
+                )
+                continue
+
+            # Compare directory contents
+            diff = _dirdiff(src_path, dst_path, shallow=not force_full)
+            if diff is None:
+                logger.info("Directory validated successfully: %s", dst_path)
+                yield ValidationEvent(program, "success", dst_path, None)
+            else:
+                diff_files, left_only, right_only = diff
+                reason = []
+                if diff_files:
+                    reason.append(f"Different files: {', '.join(diff_files[:3])}")
+                    if len(diff_files) > 3:
+                        reason[-1] += " and more"
                     logger.error(
-                        "File content mismatch: %s (backup: %d bytes, target: %d bytes)",
+                        "Directory has different files: %s - %s",
                         dst_path,
-                        src_size,
-                        dst_size,
+                        ", ".join(diff_files[:3]),
                     )
-                    validation_results[program]["failed"].append(
-                        (
-                            dst_path,
-                            f"Content mismatch (backup: {src_size} bytes, target: {dst_size} bytes)",
-                        )
+                if left_only:
+                    reason.append(f"Files only in backup: {', '.join(left_only[:3])}")
+                    if len(left_only) > 3:
+                        reason[-1] += " and more"
+                    logger.error(
+                        "Directory missing files from backup: %s - %s",
+                        dst_path,
+                        ", ".join(left_only[:3]),
                     )
-
-            # Validate directories
-            for dir_pattern in program_config.get("directories", []):
-                src_path = program_dir / dir_pattern
-                dst_path = target_dir / dir_pattern
-
-                # Check if the directory exists in the backup
-                if not src_path.exists() or not src_path.is_dir():
-                    # If the directory doesn't exist in the backup but exists in the target,
-                    # it's not a validation error (it wasn't restored)
-                    if dst_path.exists():
-                        # This is a directory that was manually created or not removed during restore
-                        logger.warning("Directory exists in target but not in backup: %s", dst_path)
-                    continue
-
-                # Now check if the directory exists in the target
-                if not dst_path.exists():
-                    all_valid = False
-                    logger.error("Directory does not exist in target: %s", dst_path)
-                    validation_results[program]["failed"].append(
-                        (dst_path, "Directory does not exist in target")
+                if right_only:
+                    reason.append(f"Files only in target: {', '.join(right_only[:3])}")
+                    if len(right_only) > 3:
+                        reason[-1] += " and more"
+                    logger.error(
+                        "Directory has extra files not in backup: %s - %s",
+                        dst_path,
+                        ", ".join(right_only[:3]),
                     )
-                    continue
+                yield ValidationEvent(program, "failed", dst_path, "; ".join(reason))
 
-                # Compare directory contents
-                comparison = filecmp.dircmp(src_path, dst_path)
-                if (
-                    not comparison.diff_files
-                    and not comparison.left_only
-                    and not comparison.right_only
-                ):
-                    logger.info("Directory validated successfully: %s", dst_path)
-                    validation_results[program]["success"].append((dst_path, None))
-                else:
-                    all_valid = False
-                    reason = []
-                    if comparison.diff_files:
-                        reason.append(f"Different files: {', '.join(comparison.diff_files[:3])}")
-                        if len(comparison.diff_files) > 3:
-                            reason[-1] += " and more"
-                        logger.error(
-                            "Directory has different files: %s - %s",
-                            dst_path,
-                            ", ".join(comparison.diff_files[:3]),
-                        )
-                    if comparison.left_only:
-                        reason.append(
-                            f"Files only in backup: {', '.join(comparison.left_only[:3])}"
-                        )
-                        if len(comparison.left_only) > 3:
-                            reason[-1] += " and more"
-                        logger.error(
-                            "Directory missing files from backup: %s - %s",
-                            dst_path,
-                            ", ".join(comparison.left_only[:3]),
-                        )
-                    if comparison.right_only:
-                        reason.append(
-                            f"Files only in target: {', '.join(comparison.right_only[:3])}"
-                        )
-                        if len(comparison.right_only) > 3:
-                            reason[-1] += " and more"
-                        logger.error(
-                            "Directory has extra files not in backup: %s - %s",
-                            dst_path,
-                            ", ".join(comparison.right_only[:3]),
-                        )
-                    validation_results[program]["failed"].append((dst_path, "; ".join(reason)))
+    def _file_event(
+        self,
+        program: str,
+        dst_path: Path,
+        matches: bool,
+        src_size: int,
+        dst_size: int,
+    ) -> ValidationEvent:
+        """Build and log the outcome of a single file comparison.
 
-        if all_valid:
-            logger.info("All files validated successfully")
-        else:
-            logger.warning("Some files failed validation")
+        Args:
+            program: Program being validated.
+            dst_path: Restored file in the target directory.
+            matches: Whether the file matches its backup.
+            src_size: Size of the backup file in bytes.
+            dst_size: Size of the restored file in bytes.
 
-        return all_valid, validation_results
+        Returns:
+            Validation event for the file.
+        """
+        if matches:
+            logger.info("File validated successfully: %s", dst_path)
+            return ValidationEvent(program, "success", dst_path, None)
+
+        logger.error(
+            "File content mismatch: %s (backup: %d bytes, target: %d bytes)",
+            dst_path,
+            src_size,
+            dst_size,
+        )
+        return ValidationEvent(
+            program,
+            "failed",
+            dst_path,
+            f"Content mismatch (backup: {src_size} bytes, target: {dst_size} bytes)",
+        )
 
     def display_validation_results(
         self,
@@ -558,8 +1441,9 @@ class RestoreManager:
                 if failed_count > 0:
                     failed_details = []
                     for path, reason in results["failed"][:3]:
-                        rel_path = path.relative_to(path.parent.parent)
-                        failed_details.append(f"{rel_path}: {reason}" if reason else str(rel_path))
+                        # Show the path as "<parent>/<name>"
+                        rel_path = os.path.join(path.parent.name, path.name)
+                        failed_details.append(f"{rel_path}: {reason}" if reason else rel_path)
 
                     if len(results["failed"]) > 3:
                         failed_details.append("...")
@@ -580,6 +1464,7 @@ class RestoreManager:
         latest: bool = False,
         force: bool = False,
         dry_run: bool = False,
+        hardlink: bool = False,
     ) -> bool:
         """Restore program configurations.
 
@@ -592,6 +1477,38 @@ class RestoreManager:
             latest: Whether to use the latest backup regardless of date.
             force: Whether to force restore over existing files.
             dry_run: Whether to perform a dry run.
+            hardlink: Hardlink files to the backup instead of copying them where
+                the filesystem allows it. Changes to restored files then also
+                change the backup.
+
+        Returns:
+            True if restore was successful, False otherwise.
+        """
+        # Backup paths are stat'ed and listed once for the whole restore and validation
+        self._backup_stats = {}
+        self._backup_listings = {}
+        self._hardlink = hardlink
+        try:
+            return self._restore(
+                repo_name, target_dir, programs, branch, date, latest, force, dry_run
+            )
+        finally:
+            self._backup_stats = None
+            self._backup_listings = None
+            self._hardlink = False
+
+    def _restore(
+        self,
+        repo_name: str,
+        target_dir: Path,
+        programs: Optional[List[str]],
+        branch: Optional[str],
+        date: Optional[str],
+        latest: bool,
+        force: bool,
+        dry_run: bool,
+    ) -> bool:
+        """Restore program configurations; see restore().
 
         Returns:
             True if restore was successful, False otherwise.
@@ -616,6 +1533,14 @@ class RestoreManager:
 
         logger.debug("Found backup at %s", backup_path)
 
+        # One listing of the backup answers both the explicit program checks and
+        # the auto-discovery below
+        try:
+            with os.scandir(backup_path) as entries:
+                backup_entries = {entry.name: entry.is_dir() for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            backup_entries = {}
+
         # Validate programs if specified
         if programs:
             for program in programs:
@@ -627,17 +1552,17 @@ class RestoreManager:
                     return False
 
                 # Check if program exists in backup
-                program_dir = backup_path / program
-                if not program_dir.exists():
+                if program not in backup_entries:
                     logger.warning("Program '%s' not found in backup at %s", program, backup_path)
                     self.console.print(f"[yellow]Program '{program}' not found in backup[/yellow]")
                     return False
         else:
             # If no programs specified, use all available in the backup
-            programs = []
-            for program_dir in backup_path.iterdir():
-                if program_dir.is_dir() and program_dir.name in self.config.programs:
-                    programs.append(program_dir.name)
+            programs = [
+                name
+                for name, is_dir in backup_entries.items()
+                if is_dir and name in self.config.programs
+            ]
 
             if not programs:
                 logger.warning("No programs found in backup to restore")
@@ -656,30 +1581,18 @@ class RestoreManager:
         # Restore each program
         any_restored = False
         files_skipped = False
-        for program in programs:
-            with self.console.status(f"Restoring {program} configurations..."):
-                result = self.restore_program(program, backup_path, target_dir, force, dry_run)
-                if result:
+        # The spinner is redrawn only when it changes, without a refresh thread
+        with Live(
+            Spinner("dots"), console=self.console, auto_refresh=False, transient=True
+        ) as live:
+            for program in programs:
+                live.update(Spinner("dots", f"Restoring {program} configurations..."), refresh=True)
+                outcome = self.restore_program(program, backup_path, target_dir, force, dry_run)
+                if outcome.success:
                     any_restored = True
-                else:
-                    # Check if files were skipped (existing files not overwritten)
-                    program_config = self.config.get_program_config(program)
-                    program_dir = backup_path / program
-                    if program_dir.exists() and program_config:
-                        for file_pattern in program_config.get("files", []):
-                            src_path = program_dir / Path(file_pattern).name
-                            dst_path = target_dir / file_pattern
-                            if src_path.exists() and dst_path.exists() and not force:
-                                files_skipped = True
-                                break
-
-                        if not files_skipped:
-                            for dir_pattern in program_config.get("directories", []):
-                                src_path = program_dir / Path(dir_pattern).name
-                                dst_path = target_dir / dir_pattern
-                                if src_path.exists() and dst_path.exists() and not force:
-                                    files_skipped = True
-                                    break
+                if outcome.skipped:
+                    # Existing files were left alone rather than overwritten
+                    files_skipped = True
 
         if not any_restored and not files_skipped:
             logger.warning("No files were restored")
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
 import glob
+import os
 import shutil
+import stat
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from rich.console import Console
 from rich.live import Live
@@ -16,6 +21,141 @@ from .repository import GitRepository
 
 console = Console()
 
+# Upper bound on directory trees removed concurrently
+_RMTREE_WORKERS = 8
+
+# Upper bound on programs wiped concurrently
+_WIPE_WORKERS = 4
+
+# Directories with more top-level entries than this are removed with rm -rf
+_RM_THRESHOLD = 50
+
+
+def _fast_rmtree(path: str) -> None:
+    """Remove a directory tree using scandir entries without extra stats.
+
+    Symlinks below the directory are unlinked, never followed. Entries
+    removed meanwhile by another wipe are skipped.
+
+    Args:
+        path: Directory to remove; must not itself be a symlink.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry.path)
+    with contextlib.suppress(FileNotFoundError):
+        os.rmdir(path)
+
+
+def _remove_tree(path: str) -> None:
+    """Remove a directory tree, handing large ones to ``rm -rf``.
+
+    rm unlinks entries without a Python call per file, which pays off for
+    trees like extension directories. Smaller trees, and systems without rm,
+    use _fast_rmtree. rm is only looked up once a large tree is found.
+
+    A symlink to a directory is unlinked; the directory it points to is left
+    alone, whatever its size.
+
+    Args:
+        path: Directory to remove.
+
+    Raises:
+        subprocess.CalledProcessError: If rm fails.
+    """
+    try:
+        if stat.S_ISLNK(os.lstat(path).st_mode):
+            os.unlink(path)
+            return
+    except FileNotFoundError:
+        return
+    rm: Optional[str] = None
+    if os.name == "posix":
+        with contextlib.suppress(FileNotFoundError), os.scandir(path) as it:
+            if any(index >= _RM_THRESHOLD for index, _ in enumerate(it)):
+                rm = shutil.which("rm")
+    if rm is not None:
+        subprocess.run([rm, "-rf", "--", path], check=True)
+    else:
+        _fast_rmtree(path)
+
+
+def _remove_dirs(paths: List[Path]) -> None:
+    """Remove several directory trees in parallel.
+
+    Directories nested inside another one in the list are left to the
+    removal of their ancestor.
+
+    Args:
+        paths: Directories to remove.
+    """
+    roots: List[Path] = []
+    for path in sorted(paths):
+        if not any(root in path.parents for root in roots):
+            roots.append(path)
+    if len(roots) == 1:
+        _remove_tree(os.fspath(roots[0]))
+        return
+    with ThreadPoolExecutor(max_workers=min(_RMTREE_WORKERS, len(roots))) as executor:
+        # list() re-raises the first removal error
+        list(executor.map(_remove_tree, map(os.fspath, roots)))
+
+
+def _assign_roots(program_paths: Dict[str, Dict[Path, bool]]) -> Dict[str, Dict[Path, bool]]:
+    """Give every path to wipe a single owning program.
+
+    A path found for several programs goes to the first of them, and paths
+    inside a directory that is wiped anyway are dropped, so concurrent wipes
+    never remove the same entry.
+
+    Args:
+        program_paths: Paths found for each program, in wipe order, mapped to
+            whether they are directories.
+
+    Returns:
+        Paths each program has to remove itself, with the same keys and values.
+    """
+    owners: Dict[Path, str] = {}
+    for program, paths in program_paths.items():
+        for path in paths:
+            owners.setdefault(path, program)
+    dirs = {path for path, program in owners.items() if program_paths[program][path]}
+    owned: Dict[str, Dict[Path, bool]] = {program: {} for program in program_paths}
+    for path, program in owners.items():
+        if not any(parent in dirs for parent in path.parents):
+            owned[program][path] = program_paths[program][path]
+    return owned
+
+
+def _has_content(path: str, want_dir: bool) -> bool:
+    """Check for a non-empty directory or file with a single stat.
+
+    Args:
+        path: Path to check; symlinks are followed.
+        want_dir: Look for a directory rather than a regular file.
+
+    Returns:
+        True for a directory with at least one entry, or a file with data.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if not want_dir:
+        return stat.S_ISREG(st.st_mode) and st.st_size > 0
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    with os.scandir(path) as it:
+        return next(it, None) is not None
+
 
 class WipeManager:
     """Wipe manager class."""
@@ -35,42 +175,34 @@ class WipeManager:
         Returns:
             Set of paths to wipe.
         """
-        paths = set()
-        program_config = self.config.get_program_config(program)
-        if not program_config:
-            return paths
+        return set(self._find_program_paths(repo, program))
 
-        # Get paths to wipe
-        files = program_config.get("files", [])
-        directories = program_config.get("directories", [])
+    def _find_program_paths(self, repo: GitRepository, program: str) -> Dict[Path, bool]:
+        """Find the paths that would be wiped for a program.
 
-        # Add directory paths first (they might contain files we want to wipe)
-        for dir_pattern in directories:
-            # Handle glob patterns
-            if "*" in dir_pattern:
-                pattern = str(repo.path / dir_pattern)
-                for path in glob.glob(pattern, recursive=True):
-                    path = Path(path)
-                    if path.is_dir() and path.exists() and any(path.iterdir()):
-                        paths.add(path)
-            else:
-                dir_path = repo.path / dir_pattern
-                if dir_path.is_dir() and dir_path.exists() and any(dir_path.iterdir()):
-                    paths.add(dir_path)
+        Args:
+            repo: Git repository to get paths for.
+            program: Program to get paths for.
 
-        # Add file paths
-        for file_pattern in files:
+        Returns:
+            Paths to wipe, mapped to whether they are directories. The check
+            made by _has_content settles this, so no further stat is needed.
+        """
+        paths: Dict[Path, bool] = {}
+
+        # Get paths to wipe; directory paths come first (they might contain files
+        # we want to wipe), then file paths
+        root = os.fspath(repo.path)
+        for pattern, want_dir, is_glob in self.config.program_entries(program):
+            full_pattern = os.path.join(root, pattern)
             # Handle glob patterns
-            if "*" in file_pattern:
-                pattern = str(repo.path / file_pattern)
-                for path in glob.glob(pattern, recursive=True):
-                    path = Path(path)
-                    if path.is_file() and path.exists() and path.stat().st_size > 0:
-                        paths.add(path)
+            if is_glob:
+                candidates = glob.glob(full_pattern, recursive=True)
             else:
-                file_path = repo.path / file_pattern
-                if file_path.is_file() and file_path.exists() and file_path.stat().st_size > 0:
-                    paths.add(file_path)
+                candidates = [full_pattern]
+            paths.update(
+                (Path(path), want_dir) for path in candidates if _has_content(path, want_dir)
+            )
 
         return paths
 
@@ -79,38 +211,66 @@ class WipeManager:
         repo: GitRepository,
         program: str,
         dry_run: bool = False,
+        paths: Optional[Set[Path]] = None,
     ) -> bool:
-        """Wipe program configurations."""
-        paths = self.get_program_paths(repo, program)
-        if not paths:
-            return False
+        """Wipe program configurations.
+
+        Args:
+            repo: Repository to wipe configurations from.
+            program: Program to wipe.
+            dry_run: Only report whether anything would be wiped.
+            paths: Paths found by get_program_paths earlier, to skip looking
+                them up again.
+
+        Returns:
+            True if anything was (or would be) wiped.
+        """
+        if paths is None:
+            return self._wipe_paths(program, self._find_program_paths(repo, program), dry_run)
+
+        # Paths passed in may have changed since they were found. One stat per
+        # path tells directories and files apart and drops the ones now gone.
+        kinds: Dict[Path, bool] = {}
+        for path in paths:
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode) or stat.S_ISREG(mode):
+                kinds[path] = stat.S_ISDIR(mode)
+        return self._wipe_paths(program, kinds, dry_run)
+
+    def _wipe_paths(self, program: str, paths: Dict[Path, bool], dry_run: bool) -> bool:
+        """Remove a program's paths, directories first.
 
-        # Check if any of the paths actually exist and have content
-        existing_paths = [
-            p
-            for p in paths
-            if p.exists()
-            and (p.is_file() and p.stat().st_size > 0 or p.is_dir() and any(p.iterdir()))
-        ]
-        if not existing_paths:
+        Args:
+            program: Program being wiped, for error messages.
+            paths: Paths to remove, mapped to whether they are directories.
+            dry_run: Only report whether anything would be wiped.
+
+        Returns:
+            True if anything was (or would be) wiped.
+        """
+        dirs = [path for path, is_dir in paths.items() if is_dir]
+        files = [path for path, is_dir in paths.items() if not is_dir]
+        if not dirs and not files:
             return False
 
         wiped = False
 
         try:
             # First wipe directories to avoid issues with files within them
-            for path in sorted(existing_paths, reverse=True):
-                if path.is_dir():
-                    if not dry_run:
-                        shutil.rmtree(path)
-                    wiped = True
-
-            # Then wipe files
-            for path in sorted(existing_paths):
-                if path.is_file():
-                    if not dry_run:
+            if dirs:
+                if not dry_run:
+                    _remove_dirs(dirs)
+                wiped = True
+
+            # Then wipe files; those inside a wiped directory are already gone
+            for path in sorted(files):
+                if not dry_run:
+                    with contextlib.suppress(FileNotFoundError):
                         path.unlink()
-                    wiped = True
+                wiped = True
 
         except Exception as e:
             console.print(f"[red]Error wiping {program}: {e}")
@@ -131,36 +291,10 @@ class WipeManager:
         if programs is None:
             programs = list(self.config.programs.keys())
 
-        # Check if any program has files to wipe
-        has_files = False
-        for program in programs:
-            paths = self.get_program_paths(repo, program)
-            if paths and any(
-                p.exists()
-                and (p.is_file() and p.stat().st_size > 0 or p.is_dir() and any(p.iterdir()))
-                for p in paths
-            ):
-                has_files = True
-                break
-
-        if not has_files:
-            self.console.print("[yellow]Warning: No configurations found to wipe")
-            return False
-
-        # Check what would be wiped
-        all_paths = set()
-        for program in programs:
-            paths = self.get_program_paths(repo, program)
-            if paths:
-                # Only include paths that actually exist and have content
-                existing_paths = [
-                    p
-                    for p in paths
-                    if p.exists()
-                    and (p.is_file() and p.stat().st_size > 0 or p.is_dir() and any(p.iterdir()))
-                ]
-                if existing_paths:
-                    all_paths.update(existing_paths)
+        # Find what would be wiped once; the same paths are used for the
+        # confirmation prompt and for wiping each program
+        program_paths = {program: self._find_program_paths(repo, program) for program in programs}
+        all_paths: Set[Path] = set().union(*program_paths.values())
 
         if not all_paths:
             self.console.print("[yellow]Warning: No configurations found to wipe")
@@ -176,12 +310,25 @@ class WipeManager:
                 return False
 
         any_wiped = False
-        # Wipe each program
-        with Live(Spinner("dots"), refresh_per_second=10) as live:
-            for program in programs:
-                live.update(Spinner("dots", f"Wiping {program} configurations..."))
-                if self.wipe_program(repo, program, dry_run):
-                    any_wiped = True
+        # Wipe the programs concurrently, each removing only the paths it owns;
+        # the spinner is updated from this thread as each one finishes
+        program_paths = _assign_roots(program_paths)
+        pending = [program for program in programs if program_paths[program]]
+        # The spinner is redrawn only when it changes, without a refresh thread
+        with Live(Spinner("dots", "Wiping configurations..."), auto_refresh=False) as live:
+            with ThreadPoolExecutor(max_workers=min(_WIPE_WORKERS, len(pending))) as executor:
+                futures = {
+                    executor.submit(
+                        self._wipe_paths, program, program_paths[program], dry_run
+                    ): program
+                    for program in pending
+                }
+                for future in as_completed(futures):
+                    live.update(
+                        Spinner("dots", f"Wiped {futures[future]} configurations"), refresh=True
+                    )
+                    if future.result():
+                        any_wiped = True
 
         if not any_wiped:
             self.console.print("[yellow]Warning: No configurations were wiped")
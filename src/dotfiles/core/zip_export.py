@@ -8,10 +8,15 @@ while maintaining the original directory structure.
 import os
 import zipfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from rich.progress import Progress, TaskID
 
+# Extensions of already-compressed files, stored without compressing them again
+_INCOMPRESSIBLE = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".gz", ".zip", ".xz", ".zst", ".bz2", ".mp4"}
+)
+
 
 class ZipExporter:
     """Handles the export of dotfiles to a zip archive."""
@@ -44,21 +49,23 @@ class ZipExporter:
         # Create parent directories if they don't exist
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Get list of files to zip
-        files_to_zip = self._get_files_to_zip()
-
-        # Create progress tracking if provided
+        # Create progress tracking if provided; the files are counted in a
+        # separate pass so they can be streamed into the archive afterwards
         task_id: Optional[TaskID] = None
         if progress:
             task_id = progress.add_task(
-                f"Creating zip archive: {self.output_path.name}", total=len(files_to_zip)
+                f"Creating zip archive: {self.output_path.name}", total=self._count_files()
             )
 
         try:
             with zipfile.ZipFile(self.output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for file_path in files_to_zip:
-                    rel_path = file_path.relative_to(self.source_dir)
-                    zf.write(file_path, rel_path)
+                for file_path, rel_path in self._iter_files():
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if os.path.splitext(rel_path)[1].lower() in _INCOMPRESSIBLE
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zf.write(file_path, rel_path, compress_type=compress_type)
 
                     if progress and task_id is not None:
                         progress.advance(task_id)
@@ -69,17 +76,42 @@ class ZipExporter:
                 self.output_path.unlink()
             raise OSError(f"Failed to create zip archive: {e}") from e
 
-    def _get_files_to_zip(self) -> List[Path]:
+    def _count_files(self) -> int:
         """
-        Get list of files to include in the zip archive.
+        Count the files to include in the zip archive.
 
         Returns:
-            List of Path objects for files to zip
+            Number of files _iter_files yields
+        """
+        return sum(1 for _ in self._iter_files())
+
+    def _iter_files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over the files to include in the zip archive.
+
+        Walks the source directory with os.scandir in the same order as
+        os.walk, without following directory symlinks.
+
+        Yields:
+            Tuples of (file path, archive name relative to the source directory)
         """
-        files = []
-        for root, _, filenames in os.walk(self.source_dir):
-            root_path = Path(root)
-            for filename in filenames:
-                file_path = root_path / filename
-                files.append(file_path)
-        return files
+        pending: List[Tuple[str, str]] = [(str(self.source_dir), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                rel_path = prefix + entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield entry.path, rel_path
+                elif not entry.is_symlink():
+                    subdirs.append((entry.path, rel_path + os.sep))
+            pending.extend(reversed(subdirs))
@@ -2,48 +2,104 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import TYPE_CHECKING, Any, Dict, Generator
 
 import pytest
 
-from dotfiles.core.backup import BackupManager
-from dotfiles.core.config import Config
-from dotfiles.core.repository import GitRepository
-from dotfiles.core.restore import RestoreManager
-from dotfiles.core.wipe import WipeManager
+# The core modules are imported inside the fixtures that need them so that
+# collecting a narrow selection of tests does not pay for importing them all.
+if TYPE_CHECKING:
+    from dotfiles.core.backup import BackupManager
+    from dotfiles.core.config import Config
+    from dotfiles.core.repository import GitRepository
+    from dotfiles.core.restore import RestoreManager
+    from dotfiles.core.wipe import WipeManager
+
+# Keep git from reading user and system config and from taking optional locks.
+# An empty template directory leaves the sample hooks out of every new .git.
+_GIT_ENV = {
+    "GIT_TEMPLATE_DIR": "",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def git_env() -> Generator[None, None, None]:
+    """Run every git command in the tests with an isolated environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in _GIT_ENV.items():
+            mp.setenv(key, value)
+        yield
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for tests."""
-    temp_dir = Path("test_temp")
-    temp_dir.mkdir(exist_ok=True)
-    yield temp_dir
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+    return tmp_path
 
 
-@pytest.fixture
-def temp_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary Git repository for testing."""
-    repo_dir = temp_dir / "git_repo"
-    repo_dir.mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a Git repository once per session to copy into each test."""
+    from dotfiles.core.repository import GitRepository
+
+    template_dir = tmp_path_factory.mktemp("template") / "git_repo"
 
     # Initialize Git repository using GitRepository class
-    repo = GitRepository(repo_dir)
+    repo = GitRepository(template_dir)
     repo.init()
 
+    return template_dir
+
+
+@pytest.fixture(scope="session")
+def readonly_git_repo(tmp_path_factory: pytest.TempPathFactory, git_repo_template: Path) -> Path:
+    """Share one Git repository between the tests that only read it.
+
+    The repository is a session-wide copy of the template, so a test that
+    breaks the read-only contract cannot change what temp_git_repo copies.
+    Tests that need to write must use temp_git_repo instead.
+    """
+    repo_dir = tmp_path_factory.mktemp("readonly") / "git_repo"
+    shutil.copytree(git_repo_template, repo_dir, symlinks=True)
+    return repo_dir
+
+
+@pytest.fixture
+def temp_git_repo(temp_dir: Path, git_repo_template: Path) -> Generator[Path, None, None]:
+    """Create a temporary Git repository for testing."""
+    repo_dir = temp_dir / "git_repo"
+    shutil.copytree(git_repo_template, repo_dir, symlinks=True, dirs_exist_ok=True)
+
     yield repo_dir
 
 
 @pytest.fixture
-def test_config() -> Config:
+def repo(temp_git_repo: Path) -> GitRepository:
+    """Create the GitRepository for the temporary Git repository."""
+    from dotfiles.core.repository import GitRepository
+
+    return GitRepository(temp_git_repo)
+
+
+@pytest.fixture
+def test_config(temp_dir: Path) -> Config:
     """Create a test configuration with cursor-focused settings."""
+    from dotfiles.core.config import Config
+
     config = Config()
     config_data: Dict[str, Any] = {
-        "backup_dir": "test_temp/backups",
+        "backup_dir": str(temp_dir / "backups"),
         "cursor": {
             "files": [
                 ".cursor/.cursorrules",
@@ -64,27 +120,37 @@ def test_config() -> Config:
     return config
 
 
-@pytest.fixture
-def test_repo(temp_dir: Path) -> GitRepository:
-    """Create a test repository."""
-    repo_dir = temp_dir / "test_repo"
-    repo_dir.mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def test_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the test repository tree once per session to copy into each test."""
+    repo_dir = tmp_path_factory.mktemp("template") / "test_repo"
+    repo_dir.mkdir()
 
     # Create test files
     cursor_dir = repo_dir / ".cursor"
     cursor_dir.mkdir(exist_ok=True)
     (cursor_dir / "rules").mkdir(exist_ok=True)
-    (cursor_dir / "rules" / "test.mdc").write_text("test")
-    (cursor_dir / ".cursorrules").write_text("test")
+    (cursor_dir / "rules" / "test.mdc").write_bytes(b"test")
+    (cursor_dir / ".cursorrules").write_bytes(b"test")
 
     vscode_dir = repo_dir / ".vscode"
     vscode_dir.mkdir(exist_ok=True)
-    (vscode_dir / "settings.json").write_text('{"test": true}')
-    (vscode_dir / "extensions.json").write_text('{"recommendations": []}')
+    (vscode_dir / "settings.json").write_bytes(b'{"test": true}')
+    (vscode_dir / "extensions.json").write_bytes(b'{"recommendations": []}')
+
+    (repo_dir / ".gitconfig").write_bytes(b"[user]\n\tname = Test User")
+    (repo_dir / ".gitignore").write_bytes(b"*.pyc\n__pycache__/")
+
+    return repo_dir
 
-    (repo_dir / ".gitconfig").write_text("[user]\n\tname = Test User")
-    (repo_dir / ".gitignore").write_text("*.pyc\n__pycache__/")
 
+@pytest.fixture
+def test_repo(temp_dir: Path, test_repo_template: Path) -> GitRepository:
+    """Create a test repository."""
+    from dotfiles.core.repository import GitRepository
+
+    repo_dir = temp_dir / "test_repo"
+    shutil.copytree(test_repo_template, repo_dir, dirs_exist_ok=True)
     return GitRepository(repo_dir)
 
 
@@ -99,10 +165,10 @@ def backup_dir(temp_dir: Path) -> Path:
 @pytest.fixture
 def backup_manager(test_config: Config) -> BackupManager:
     """Create a backup manager for testing."""
+    from dotfiles.core.backup import BackupManager
+
     manager = BackupManager(test_config)
-    manager.backup_dir = Path("test_temp/backups")
-    if manager.backup_dir.exists():
-        shutil.rmtree(manager.backup_dir)
+    manager.backup_dir = Path(test_config.get("backup_dir"))
     manager.backup_dir.mkdir(parents=True, exist_ok=True)
     return manager
 
@@ -110,6 +176,8 @@ def backup_manager(test_config: Config) -> BackupManager:
 @pytest.fixture
 def restore_manager(test_config: Config, backup_manager: BackupManager) -> RestoreManager:
     """Create a restore manager for testing."""
+    from dotfiles.core.restore import RestoreManager
+
     manager = RestoreManager(test_config, backup_manager)
     manager.backup_dir = backup_manager.backup_dir
     return manager
@@ -118,4 +186,6 @@ def restore_manager(test_config: Config, backup_manager: BackupManager) -> Resto
 @pytest.fixture
 def wipe_manager(test_config: Config) -> WipeManager:
     """Create a wipe manager for testing."""
+    from dotfiles.core.wipe import WipeManager
+
     return WipeManager(test_config)
@@ -1,45 +1,41 @@
 """Test backup module."""
 
+from __future__ import annotations
+
 import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Set
 
 import pytest
 
-from dotfiles.core.backup import BackupManager
-from dotfiles.core.config import Config
 from dotfiles.core.repository import GitRepository
 
+if TYPE_CHECKING:
+    from dotfiles.core.backup import BackupManager
 
-def create_test_files(repo_path: Path) -> None:
-    """Create test files for backup testing."""
-    # Create test directories
-    cursor_dir = repo_path / ".cursor"
-    cursor_dir.mkdir(exist_ok=True)
-    (cursor_dir / "rules").mkdir(exist_ok=True)
-    (cursor_dir / "rules" / "test.mdc").write_text("test")
-    (cursor_dir / ".cursorrules").write_text("test")
-
-    vscode_dir = repo_path / ".vscode"
-    vscode_dir.mkdir(exist_ok=True)
-    (vscode_dir / "settings.json").write_text('{"test": true}')
-    (vscode_dir / "extensions.json").write_text('{"recommendations": []}')
+# Files created by create_test_files, relative to the repository
+_TEST_FILES = (
+    (".cursor/rules/test.mdc", b"test"),
+    (".cursor/.cursorrules", b"test"),
+    (".vscode/settings.json", b'{"test": true}'),
+    (".vscode/extensions.json", b'{"recommendations": []}'),
+    (".gitconfig", b"[user]\n\tname = Test User"),
+    (".gitignore", b"*.pyc\n__pycache__/"),
+)
 
-    (repo_path / ".gitconfig").write_text("[user]\n\tname = Test User")
-    (repo_path / ".gitignore").write_text("*.pyc\n__pycache__/")
 
-
-@pytest.fixture
-def backup_manager(test_config: Config) -> BackupManager:
-    """Create a backup manager with test configuration."""
-    manager = BackupManager(test_config)
-    manager.backup_dir = Path("test_temp/backups")
-    manager.backup_dir.mkdir(parents=True, exist_ok=True)
-    return manager
+def create_test_files(repo_path: Path) -> None:
+    """Create test files for backup testing."""
+    # Create each test directory once, then the files
+    for parent in dict.fromkeys((repo_path / rel).parent for rel, _ in _TEST_FILES):
+        parent.mkdir(parents=True, exist_ok=True)
+    for rel, content in _TEST_FILES:
+        (repo_path / rel).write_bytes(content)
 
 
-def test_backup_path(backup_manager: BackupManager, temp_git_repo: Path) -> None:
+def test_backup_path(backup_manager: BackupManager, readonly_git_repo: Path) -> None:
     """Test backup path generation."""
-    repo = GitRepository(temp_git_repo)
+    repo = GitRepository(readonly_git_repo)
     path = backup_manager.backup_path(repo)
     assert path.parent.name == repo.get_current_branch()
     assert path.parent.parent.name == repo.name
@@ -47,9 +43,16 @@ def test_backup_path(backup_manager: BackupManager, temp_git_repo: Path) -> None
 
 def test_list_backups_empty(backup_manager: BackupManager, temp_dir: Path) -> None:
     """Test listing backups when none exist."""
-    with pytest.MonkeyPatch.context() as mp:
-        mp.chdir(temp_dir)
-        assert not backup_manager.list_backups()
+    assert not backup_manager.list_backups(root=temp_dir)
+
+
+def test_list_backups_relative_root(backup_manager: BackupManager, temp_dir: Path) -> None:
+    """Test resolving a relative backup directory against an explicit root."""
+    backup_path = temp_dir / "backups" / "test_repo" / "main" / "20250101-120000"
+    backup_path.mkdir(parents=True)
+    backup_manager.backup_dir = Path("backups")
+
+    assert backup_manager.list_backups("test_repo", root=temp_dir) == [backup_path]
 
 
 def test_list_backups(backup_manager: BackupManager, temp_dir: Path) -> None:
@@ -75,68 +78,44 @@ def test_list_backups(backup_manager: BackupManager, temp_dir: Path) -> None:
     assert backups[0].parent.parent.name == repo_name
 
 
-def test_backup_program(backup_manager: BackupManager, temp_git_repo: Path) -> None:
-    """Test backing up a single program."""
-    create_test_files(temp_git_repo)
-    repo = GitRepository(temp_git_repo)
-
-    # Backup cursor program
-    assert backup_manager.backup(repo, programs=["cursor"])
-
-    # Get latest backup
-    backups = backup_manager.list_backups(repo.name)
-    assert len(backups) == 1
-    backup_path = backups[0]
-
-    # Verify cursor was backed up
-    assert (backup_path / "cursor").exists()
-    assert (backup_path / "cursor" / ".cursor" / ".cursorrules").exists()
-    assert not (backup_path / "vscode").exists()
-    assert not (backup_path / "git").exists()
-
-
-def test_backup_all_programs(backup_manager: BackupManager, temp_git_repo: Path) -> None:
-    """Test backing up all programs."""
-    create_test_files(temp_git_repo)
-    repo = GitRepository(temp_git_repo)
-
-    # Backup all programs
-    assert backup_manager.backup(repo)
-
-    # Get latest backup
-    backups = backup_manager.list_backups(repo.name)
-    assert len(backups) == 1
-    backup_path = backups[0]
-
-    # Verify all programs were backed up
-    assert (backup_path / "cursor").exists()
-    assert (backup_path / "vscode").exists()
-    assert (backup_path / "git").exists()
+_PROGRAMS = ("cursor", "vscode", "git")
 
 
-def test_backup_specific_program(backup_manager: BackupManager, temp_git_repo: Path) -> None:
-    """Test backing up a specific program."""
-    create_test_files(temp_git_repo)
-    repo = GitRepository(temp_git_repo)
+@pytest.mark.parametrize(
+    "programs,expected",
+    [
+        (["cursor"], {"cursor"}),
+        (None, {"cursor", "vscode", "git"}),
+        (["vscode"], {"vscode"}),
+    ],
+    ids=["cursor", "all", "vscode"],
+)
+def test_backup_programs(
+    backup_manager: BackupManager,
+    repo: GitRepository,
+    programs: Optional[List[str]],
+    expected: Set[str],
+) -> None:
+    """Test backing up a selection of programs."""
+    create_test_files(repo.path)
 
-    # Backup only vscode
-    assert backup_manager.backup(repo, programs=["vscode"])
+    assert backup_manager.backup(repo, programs=programs)
 
     # Get latest backup
     backups = backup_manager.list_backups(repo.name)
     assert len(backups) == 1
     backup_path = backups[0]
 
-    # Verify only vscode was backed up
-    assert not (backup_path / "cursor").exists()
-    assert (backup_path / "vscode").exists()
-    assert not (backup_path / "git").exists()
+    # Verify exactly the selected programs were backed up
+    for program in _PROGRAMS:
+        assert (backup_path / program).exists() == (program in expected)
+    if "cursor" in expected:
+        assert (backup_path / "cursor" / ".cursor" / ".cursorrules").exists()
 
 
-def test_backup_dry_run(backup_manager: BackupManager, temp_git_repo: Path) -> None:
+def test_backup_dry_run(backup_manager: BackupManager, repo: GitRepository) -> None:
     """Test backup dry run."""
-    create_test_files(temp_git_repo)
-    repo = GitRepository(temp_git_repo)
+    create_test_files(repo.path)
 
     # Perform dry run
     assert backup_manager.backup(repo, dry_run=True)
@@ -145,10 +124,9 @@ def test_backup_dry_run(backup_manager: BackupManager, temp_git_repo: Path) -> N
     assert not backup_manager.list_backups(repo.name)
 
 
-def test_backup_branch(backup_manager: BackupManager, temp_git_repo: Path) -> None:
+def test_backup_branch(backup_manager: BackupManager, repo: GitRepository) -> None:
     """Test backup with specific branch."""
-    create_test_files(temp_git_repo)
-    repo = GitRepository(temp_git_repo)
+    create_test_files(repo.path)
 
     # Create and switch to feature branch
     repo.path.joinpath("feature.txt").write_text("feature")
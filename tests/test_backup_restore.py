@@ -1,230 +1,240 @@
 """Tests for backup and restore functionality."""
 
+import os
 import shutil
-import tempfile
 from pathlib import Path
-from unittest import TestCase
+
+import pytest
 
 from src.dotfiles.core.backup import BackupManager
 from src.dotfiles.core.config import Config
 from src.dotfiles.core.repository import GitRepository
 from src.dotfiles.core.restore import RestoreManager
 
-
-class TestBackupRestore(TestCase):
-    """Test backup and restore functionality."""
-
-    def setUp(self) -> None:
-        """Set up the test environment."""
-        # Create temporary directories
-        self.source_dir = Path(tempfile.mkdtemp())
-        self.target_dir = Path(tempfile.mkdtemp())
-        self.backup_dir = Path(tempfile.mkdtemp())
-
-        # Create test files in source_dir
-        cursor_dir = self.source_dir / ".cursor"
-        cursor_rules_dir = cursor_dir / "rules"
-        cursor_rules_dir.mkdir(parents=True, exist_ok=True)
-
-        vscode_dir = self.source_dir / ".vscode"
-        vscode_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create test files
-        self.test_files = [
-            cursor_dir / ".cursorrules",
-            cursor_rules_dir / "test.mdc",
-            vscode_dir / "settings.json",
-        ]
-
-        for file_path in self.test_files:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(f"Test content for {file_path.name}")
-
-        # Initialize Git repository in source_dir
-        self.repo = GitRepository(self.source_dir)
-        self.repo.init()  # This will create an initial commit with all files
-
-        # Create config
-        self.config = Config()
-
-        # Create backup manager
-        self.backup_manager = BackupManager(self.config)
-        self.backup_manager.backup_dir = self.backup_dir
-
-        # Initialize restore manager
-        self.restore_manager = RestoreManager(self.config, self.backup_manager)
-        self.restore_manager.backup_dir = self.backup_dir
-
-        # Create target directory structure
-        (self.target_dir / ".cursor").mkdir(exist_ok=True)
-        (self.target_dir / ".vscode").mkdir(exist_ok=True)
-
-    def tearDown(self) -> None:
-        """Clean up test environment."""
-        shutil.rmtree(self.source_dir)
-        shutil.rmtree(self.target_dir)
-        shutil.rmtree(self.backup_dir)
-
-    def test_backup(self) -> None:
-        """Test backup functionality."""
-        # Create repository
-        repo = GitRepository(self.source_dir)
-
-        # Backup
-        result = self.backup_manager.backup(repo)
-        self.assertTrue(result)
-
-        # Check if backup directory exists
-        repo_backup_dir = self.backup_dir / repo.name / repo.get_current_branch()
-        self.assertTrue(repo_backup_dir.exists())
-
-        # Get latest backup
-        backups = list(repo_backup_dir.iterdir())
-        self.assertTrue(len(backups) > 0)
-        latest_backup = max(backups, key=lambda p: p.name)
-
-        # Check if cursor directory exists in backup
-        cursor_backup_dir = latest_backup / "cursor"
-        self.assertTrue(cursor_backup_dir.exists())
-
-        # Check if cursor files were backed up
-        self.assertTrue((cursor_backup_dir / ".cursor" / ".cursorrules").exists())
-        self.assertTrue((cursor_backup_dir / ".cursor").exists())
-        self.assertTrue((cursor_backup_dir / ".cursor" / "rules").exists())
-        self.assertTrue((cursor_backup_dir / ".cursor" / "rules" / "test.mdc").exists())
-
-        # Check if vscode directory exists in backup
-        vscode_backup_dir = latest_backup / "vscode"
-        self.assertTrue(vscode_backup_dir.exists())
-
-        # Check if vscode files were backed up
-        self.assertTrue((vscode_backup_dir / ".vscode").exists())
-        self.assertTrue((vscode_backup_dir / ".vscode" / "settings.json").exists())
-
-        # Store the latest backup path for other tests to use
-        self.latest_backup = latest_backup
-
-    def test_restore(self) -> None:
-        """Test restore functionality."""
-        # Backup first
-        self.test_backup()
-        latest_backup = self.latest_backup
-
-        # Remove the target files and directories
-        if (self.target_dir / ".cursor").exists():
-            shutil.rmtree(self.target_dir / ".cursor")
-        if (self.target_dir / ".vscode").exists():
-            shutil.rmtree(self.target_dir / ".vscode")
-
-        # Restore
-        result = self.restore_manager.restore(self.repo.name, self.target_dir)
-        self.assertTrue(result)
-
-        # Verify files were restored
-        for file_path in [
-            self.target_dir / ".cursor" / "rules" / "test.mdc",
-            self.target_dir / ".cursor" / ".cursorrules",
-            self.target_dir / ".vscode" / "settings.json",
-        ]:
-            self.assertTrue(file_path.exists())
-            self.assertEqual(file_path.read_text(), f"Test content for {file_path.name}")
-
-    def test_restore_with_modifications(self) -> None:
-        """Test restore with modifications."""
-        # Backup first
-        self.test_backup()
-        latest_backup = self.latest_backup
-
-        # Create target directories if they don't exist
-        (self.target_dir / ".cursor" / "rules").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / ".vscode").mkdir(parents=True, exist_ok=True)
-
-        # Modify the target files
-        test_files = [
-            self.target_dir / ".cursor" / "rules" / "test.mdc",
-            self.target_dir / ".cursorrules",
-            self.target_dir / ".vscode" / "settings.json",
-        ]
-
-        for file_path in test_files:
-            file_path.write_text(f"Modified content for {file_path.name}")
-
-        # Restore should return True even if files were skipped
-        result = self.restore_manager.restore(self.repo.name, self.target_dir)
-        self.assertTrue(result)  # Changed from assertFalse to assertTrue
-
-        # Verify files were not restored (content should still be modified)
-        for file_path in test_files:
-            self.assertEqual(file_path.read_text(), f"Modified content for {file_path.name}")
-
-        # Validate restore
-        is_valid, validation_results = self.restore_manager.validate_restore(
-            latest_backup, self.target_dir, ["cursor", "vscode"]
-        )
-        self.assertFalse(is_valid)
-
-    def test_restore_with_missing_files(self) -> None:
-        """Test restore with missing files."""
-        # Create a backup
-        self.backup_manager.backup(self.repo, ["cursor", "vscode"])
-
-        # Remove some target files and directories to simulate a clean environment
-        shutil.rmtree(self.target_dir / ".cursor", ignore_errors=True)
-        shutil.rmtree(self.target_dir / ".vscode", ignore_errors=True)
-
-        # Restore should succeed for existing files
-        result = self.restore_manager.restore(self.repo.name, self.target_dir, ["cursor", "vscode"])
-
-        # Restore should return True because files were restored
-        self.assertTrue(result)
-
-        # Verify that files were restored
-        self.assertTrue((self.target_dir / ".cursor").exists())
-        self.assertTrue((self.target_dir / ".vscode").exists())
-
-        # For this test, we'll verify that the restore method returns True
-        # even if validation would fail. This is the expected behavior since
-        # the restore method should return True if any files were restored,
-        # regardless of validation results.
-        #
-        # In a real scenario, validation might fail if files are missing from
-        # the backup, but the restore operation itself would still be considered
-        # successful if it restored the files that were available.
-        self.assertTrue(
-            result,
-            "Restore should return True if files were restored, even if validation would fail",
-        )
-
-    def test_force_restore(self) -> None:
-        """Test force restore."""
-        # Backup first
-        self.test_backup()
-        latest_backup = self.latest_backup
-
-        # Create target directories if they don't exist
-        (self.target_dir / ".cursor" / "rules").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / ".vscode").mkdir(parents=True, exist_ok=True)
-
-        # Modify the target files
-        test_files = [
-            self.target_dir / ".cursor" / "rules" / "test.mdc",
-            self.target_dir / ".cursor" / ".cursorrules",
-            self.target_dir / ".vscode" / "settings.json",
-        ]
-
-        for file_path in test_files:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(f"Modified content for {file_path.name}")
-
-        # Restore with force
-        result = self.restore_manager.restore(self.repo.name, self.target_dir, force=True)
-        self.assertTrue(result)
-
-        # Verify files were restored
-        for file_path in [
-            self.target_dir / ".cursor" / "rules" / "test.mdc",
-            self.target_dir / ".cursor" / ".cursorrules",
-            self.target_dir / ".vscode" / "settings.json",
-        ]:
-            self.assertTrue(file_path.exists())
-            self.assertEqual(file_path.read_text(), f"Test content for {file_path.name}")
+# Files in the source repository, relative to its root
+_SOURCE_FILES = (
+    ".cursor/.cursorrules",
+    ".cursor/rules/test.mdc",
+    ".vscode/settings.json",
+)
+
+
+@pytest.fixture(scope="module")
+def source_repo(tmp_path_factory: pytest.TempPathFactory) -> GitRepository:
+    """Create the source repository once for all tests."""
+    source_dir = tmp_path_factory.mktemp("source")
+
+    # Create test files in source_dir
+    for rel_path in _SOURCE_FILES:
+        file_path = source_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"Test content for {file_path.name}")
+
+    # Initialize Git repository in source_dir
+    repo = GitRepository(source_dir)
+    repo.init()  # This will create an initial commit with all files
+    return repo
+
+
+@pytest.fixture(scope="module")
+def backup_manager(tmp_path_factory: pytest.TempPathFactory) -> BackupManager:
+    """Create a backup manager with its own backup directory."""
+    manager = BackupManager(Config())
+    manager.backup_dir = tmp_path_factory.mktemp("backups")
+    return manager
+
+
+@pytest.fixture(scope="module")
+def backup_result(backup_manager: BackupManager, source_repo: GitRepository) -> bool:
+    """Back up the source repository once; the restore tests only read the backup."""
+    return backup_manager.backup(source_repo)
+
+
+@pytest.fixture
+def latest_backup(
+    backup_manager: BackupManager, source_repo: GitRepository, backup_result: bool
+) -> Path:
+    """Get the backup of the source repository."""
+    assert backup_result
+
+    # Check if backup directory exists
+    repo_backup_dir = (
+        backup_manager.backup_dir / source_repo.name / source_repo.get_current_branch()
+    )
+    assert repo_backup_dir.exists()
+
+    # Get latest backup
+    with os.scandir(repo_backup_dir) as entries:
+        latest_name = max((entry.name for entry in entries), default=None)
+    assert latest_name is not None
+    return repo_backup_dir / latest_name
+
+
+@pytest.fixture
+def restore_manager(backup_manager: BackupManager) -> RestoreManager:
+    """Create a restore manager reading from the shared backup directory."""
+    manager = RestoreManager(backup_manager.config, backup_manager)
+    manager.backup_dir = backup_manager.backup_dir
+    return manager
+
+
+@pytest.fixture
+def target_dir(tmp_path: Path) -> Path:
+    """Create the target directory structure."""
+    (tmp_path / ".cursor").mkdir()
+    (tmp_path / ".vscode").mkdir()
+    return tmp_path
+
+
+def test_backup(latest_backup: Path) -> None:
+    """Test backup functionality."""
+    # Check if cursor directory exists in backup
+    cursor_backup_dir = latest_backup / "cursor"
+    assert cursor_backup_dir.exists()
+
+    # Check if cursor files were backed up
+    assert (cursor_backup_dir / ".cursor" / ".cursorrules").exists()
+    assert (cursor_backup_dir / ".cursor").exists()
+    assert (cursor_backup_dir / ".cursor" / "rules").exists()
+    assert (cursor_backup_dir / ".cursor" / "rules" / "test.mdc").exists()
+
+    # Check if vscode directory exists in backup
+    vscode_backup_dir = latest_backup / "vscode"
+    assert vscode_backup_dir.exists()
+
+    # Check if vscode files were backed up
+    assert (vscode_backup_dir / ".vscode").exists()
+    assert (vscode_backup_dir / ".vscode" / "settings.json").exists()
+
+
+def test_restore(
+    restore_manager: RestoreManager,
+    source_repo: GitRepository,
+    target_dir: Path,
+    latest_backup: Path,
+) -> None:
+    """Test restore functionality."""
+    # Remove the target files and directories
+    if (target_dir / ".cursor").exists():
+        shutil.rmtree(target_dir / ".cursor")
+    if (target_dir / ".vscode").exists():
+        shutil.rmtree(target_dir / ".vscode")
+
+    # Restore
+    result = restore_manager.restore(source_repo.name, target_dir)
+    assert result
+
+    # Verify files were restored
+    for file_path in [
+        target_dir / ".cursor" / "rules" / "test.mdc",
+        target_dir / ".cursor" / ".cursorrules",
+        target_dir / ".vscode" / "settings.json",
+    ]:
+        assert file_path.exists()
+        assert file_path.read_text() == f"Test content for {file_path.name}"
+
+
+def test_restore_with_modifications(
+    restore_manager: RestoreManager,
+    source_repo: GitRepository,
+    target_dir: Path,
+    latest_backup: Path,
+) -> None:
+    """Test restore with modifications."""
+    # Create target directories if they don't exist
+    (target_dir / ".cursor" / "rules").mkdir(parents=True, exist_ok=True)
+    (target_dir / ".vscode").mkdir(parents=True, exist_ok=True)
+
+    # Modify the target files
+    test_files = [
+        target_dir / ".cursor" / "rules" / "test.mdc",
+        target_dir / ".cursorrules",
+        target_dir / ".vscode" / "settings.json",
+    ]
+
+    for file_path in test_files:
+        file_path.write_text(f"Modified content for {file_path.name}")
+
+    # Restore should return True even if files were skipped
+    result = restore_manager.restore(source_repo.name, target_dir)
+    assert result
+
+    # Verify files were not restored (content should still be modified)
+    for file_path in test_files:
+        assert file_path.read_text() == f"Modified content for {file_path.name}"
+
+    # Validate restore
+    is_valid, validation_results = restore_manager.validate_restore(
+        latest_backup, target_dir, ["cursor", "vscode"]
+    )
+    assert not is_valid
+
+
+def test_restore_with_missing_files(
+    restore_manager: RestoreManager,
+    source_repo: GitRepository,
+    target_dir: Path,
+    latest_backup: Path,
+) -> None:
+    """Test restore with missing files."""
+    # Remove some target files and directories to simulate a clean environment
+    shutil.rmtree(target_dir / ".cursor", ignore_errors=True)
+    shutil.rmtree(target_dir / ".vscode", ignore_errors=True)
+
+    # Restore should succeed for existing files
+    result = restore_manager.restore(source_repo.name, target_dir, ["cursor", "vscode"])
+
+    # Restore should return True because files were restored
+    assert result
+
+    # Verify that files were restored
+    assert (target_dir / ".cursor").exists()
+    assert (target_dir / ".vscode").exists()
+
+    # For this test, we'll verify that the restore method returns True
+    # even if validation would fail. This is the expected behavior since
+    # the restore method should return True if any files were restored,
+    # regardless of validation results.
+    #
+    # In a real scenario, validation might fail if files are missing from
+    # the backup, but the restore operation itself would still be considered
+    # successful if it restored the files that were available.
+    assert (
+        result
+    ), "Restore should return True if files were restored, even if validation would fail"
+
+
+def test_force_restore(
+    restore_manager: RestoreManager,
+    source_repo: GitRepository,
+    target_dir: Path,
+    latest_backup: Path,
+) -> None:
+    """Test force restore."""
+    # Create target directories if they don't exist
+    (target_dir / ".cursor" / "rules").mkdir(parents=True, exist_ok=True)
+    (target_dir / ".vscode").mkdir(parents=True, exist_ok=True)
+
+    # Modify the target files
+    test_files = [
+        target_dir / ".cursor" / "rules" / "test.mdc",
+        target_dir / ".cursor" / ".cursorrules",
+        target_dir / ".vscode" / "settings.json",
+    ]
+
+    for file_path in test_files:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"Modified content for {file_path.name}")
+
+    # Restore with force
+    result = restore_manager.restore(source_repo.name, target_dir, force=True)
+    assert result
+
+    # Verify files were restored
+    for file_path in [
+        target_dir / ".cursor" / "rules" / "test.mdc",
+        target_dir / ".cursor" / ".cursorrules",
+        target_dir / ".vscode" / "settings.json",
+    ]:
+        assert file_path.exists()
+        assert file_path.read_text() == f"Test content for {file_path.name}"
@@ -3,6 +3,8 @@
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from dotfiles.core.branch import (
     get_current_branch,
     has_changes,
@@ -12,14 +14,61 @@ from dotfiles.core.branch import (
     stash_changes,
     switch_branch,
 )
+from dotfiles.core.repository import GitRepository
 
 
-def test_get_current_branch(temp_git_repo: Path) -> None:
+def test_get_current_branch(readonly_git_repo: Path) -> None:
     """Test getting current branch name."""
-    branch = get_current_branch(temp_git_repo)
+    branch = get_current_branch(readonly_git_repo)
     assert branch == "main"
 
 
+def test_repository_branch_follows_outside_checkout(temp_git_repo: Path) -> None:
+    """Test that GitRepository sees a branch switched by another process."""
+    repo = GitRepository(temp_git_repo)
+    assert repo.get_current_branch() == "main"
+
+    subprocess.run(["git", "checkout", "-q", "-b", "feature"], cwd=temp_git_repo, check=True)
+    assert repo.get_current_branch() == "feature"
+
+
+def test_repository_branch_reads_head(
+    readonly_git_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a checked-out branch is read from .git/HEAD without running git."""
+
+    def no_git(self: GitRepository, *args: str) -> str:
+        raise AssertionError(f"git {' '.join(args)} was run")
+
+    monkeypatch.setattr(GitRepository, "_run_git", no_git)
+    assert GitRepository(readonly_git_repo).get_current_branch() == "main"
+
+
+def test_repository_branch_detached_head(temp_git_repo: Path) -> None:
+    """Test the current branch of a repository with a detached HEAD."""
+    subprocess.run(["git", "checkout", "-q", "--detach"], cwd=temp_git_repo, check=True)
+    assert GitRepository(temp_git_repo).get_current_branch() == "HEAD"
+
+
+def test_repository_branch_worktree(temp_git_repo: Path, tmp_path: Path) -> None:
+    """Test the current branch of a worktree, whose .git is a file."""
+    worktree = tmp_path / "worktree"
+    subprocess.run(
+        ["git", "worktree", "add", "-q", "-b", "feature", str(worktree)],
+        cwd=temp_git_repo,
+        check=True,
+    )
+    assert (worktree / ".git").is_file()
+    assert GitRepository(worktree).get_current_branch() == "feature"
+
+
+def test_repository_branch_subdirectory(temp_git_repo: Path) -> None:
+    """Test the current branch seen from a directory inside the repository."""
+    subdir = temp_git_repo / "sub"
+    subdir.mkdir()
+    assert GitRepository(subdir).get_current_branch() == "main"
+
+
 def test_list_branches(temp_git_repo: Path) -> None:
     """Test listing branches."""
     # Create test branches
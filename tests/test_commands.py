@@ -2,12 +2,14 @@
 
 import zipfile
 from pathlib import Path
+from typing import Dict, List
 
 import pytest
 from click.testing import CliRunner
 
 from dotfiles.cli import cli
 from dotfiles.core.repository import GitRepository
+from dotfiles.core.restore import RestoreManager
 
 
 @pytest.fixture
@@ -70,6 +72,22 @@ def test_restore(cli_runner: CliRunner, test_repo: GitRepository) -> None:
     )
 
 
+def test_restore_hardlink_option(
+    cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that --hardlink is passed on to the restore manager."""
+    calls: List[Dict[str, object]] = []
+
+    def restore(self: RestoreManager, *args: object, **kwargs: object) -> bool:
+        calls.append(kwargs)
+        return True
+
+    monkeypatch.setattr(RestoreManager, "restore", restore)
+    result = cli_runner.invoke(cli, ["restore", "test_repo", str(tmp_path), "--hardlink"])
+    assert result.exit_code == 0
+    assert calls[0]["hardlink"] is True
+
+
 def test_list_command(cli_runner: CliRunner, test_repo: GitRepository) -> None:
     """Test list command."""
     # First create a backup
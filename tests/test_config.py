@@ -85,6 +85,18 @@ def test_program_config() -> None:
     assert ".cursor" in cursor_config["directories"]
 
 
+def test_program_entries() -> None:
+    """Test flat program entries and their invalidation on merge."""
+    config = Config()
+    entries = config.program_entries("cursor")
+    assert entries[0] == (".cursor", True, False)
+    assert (".cursor/rules/*.mdc", False, True) in entries
+    assert config.program_entries("unknown") == ()
+
+    config._merge_config({"programs": {"cursor": {"name": "Cursor", "paths": [".cursorrc"]}}})
+    assert config.program_entries("cursor") == ((".cursorrc", False, False),)
+
+
 def test_invalid_config() -> None:
     """Test handling of invalid configuration."""
     # This test is a placeholder for future validation testing
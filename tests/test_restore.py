@@ -1,15 +1,19 @@
 """Tests for restore functionality."""
 
+import errno
+import itertools
+import os
 import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, List, Tuple
 
 import pytest
 
+from dotfiles.core import restore
 from dotfiles.core.backup import BackupManager
 from dotfiles.core.config import Config
 from dotfiles.core.repository import GitRepository
-from dotfiles.core.restore import RestoreManager
+from dotfiles.core.restore import RestoreManager, RestoreOutcome, ValidationEvent
 from tests.test_backup import create_test_files
 
 
@@ -40,11 +44,6 @@ def clean_test_files(temp_git_repo: Path) -> Generator[None, None, None]:
             else:
                 test_path.unlink()
 
-    # Clean up any existing backups
-    backup_dir = Path("test_temp/backups")
-    if backup_dir.exists():
-        shutil.rmtree(backup_dir)
-
     yield
 
     # Clean up after test
@@ -56,10 +55,6 @@ def clean_test_files(temp_git_repo: Path) -> Generator[None, None, None]:
             else:
                 test_path.unlink()
 
-    # Clean up backups again
-    if backup_dir.exists():
-        shutil.rmtree(backup_dir)
-
 
 @pytest.fixture
 def backup_with_files(backup_manager: BackupManager, temp_git_repo: Path) -> Path:
@@ -116,6 +111,290 @@ def test_find_backup_with_branch(restore_manager: RestoreManager, backup_with_fi
     assert backup == backup_with_files
 
 
+def test_find_backup_sees_new_backup(
+    restore_manager: RestoreManager, backup_with_files: Path
+) -> None:
+    """Test that a backup created right after a lookup is found by the next one."""
+    repo_name = backup_with_files.parent.parent.name
+    assert restore_manager.find_backup(repo_name) == backup_with_files
+
+    newer = backup_with_files.parent / "99991231-235959"
+    newer.mkdir()
+    backup = restore_manager.find_backup(repo_name)
+    assert backup is not None
+    assert backup.name == newer.name
+
+
+def test_find_backup_by_date(restore_manager: RestoreManager) -> None:
+    """Test finding the newest backup on a date among backups of neighbouring dates."""
+    repo_dir = Path(restore_manager.config.get("backup_dir")) / "proj"
+    for branch, name in (
+        ("main", "20250101-235959"),
+        ("main", "20250102-000000"),
+        ("main", "20250102-080000"),
+        ("dev", "20250102-120000"),
+        ("main", "20250102-235959"),
+        ("main", "20250103-000000"),
+    ):
+        (repo_dir / branch / name).mkdir(parents=True)
+
+    assert restore_manager.find_backup("proj", date="20250102") == (
+        repo_dir / "main" / "20250102-235959"
+    )
+    assert restore_manager.find_backup("proj", branch="dev", date="20250102") == (
+        repo_dir / "dev" / "20250102-120000"
+    )
+    assert restore_manager.find_backup("proj", date="20250102-080000") == (
+        repo_dir / "main" / "20250102-080000"
+    )
+    assert restore_manager.find_backup("proj", date="20250104") is None
+    assert restore_manager.find_backup("proj", date="20250102-090000") is None
+
+
+def test_reset_cache_finds_new_backup(
+    restore_manager: RestoreManager, backup_with_files: Path
+) -> None:
+    """Test that a backup created after a lookup is found once the cache is reset."""
+    repo_name = backup_with_files.parent.parent.name
+    assert restore_manager.find_backup(repo_name) == backup_with_files
+
+    newer = backup_with_files.parent / "99991231-235959"
+    newer.mkdir()
+    restore_manager.reset_cache()
+    backup = restore_manager.find_backup(repo_name)
+    assert backup is not None
+    assert backup.name == newer.name
+
+
+def test_program_paths_follow_reloaded_config(
+    restore_manager: RestoreManager, test_config: Config, temp_git_repo: Path, tmp_path: Path
+) -> None:
+    """Test that the manager picks up patterns from a reloaded configuration."""
+    repo = GitRepository(temp_git_repo)
+    assert temp_git_repo / ".cursor/.cursorrules" in restore_manager.get_program_paths(
+        repo, "cursor"
+    )
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "programs:\n  cursor:\n    name: Cursor\n    paths: [.cursor/other.json]\n"
+    )
+    test_config.load_config(config_file)
+    assert restore_manager.get_program_paths(repo, "cursor") == {
+        temp_git_repo / ".cursor/other.json"
+    }
+
+
+def test_force_restore_skips_unchanged_file(
+    restore_manager: RestoreManager, tmp_path: Path
+) -> None:
+    """Test that a forced restore leaves a target matching its backup file alone."""
+    src_file = tmp_path / "saved" / ".gitconfig"
+    src_file.parent.mkdir()
+    src_file.write_text("[user]")
+    target = tmp_path / "repo" / ".gitconfig"
+
+    assert restore_manager._restore_file(src_file, target, force=True)
+    # A second link shows whether the target was replaced
+    os.link(target, tmp_path / "link")
+    assert restore_manager._restore_file(src_file, target, force=True)
+    assert target.stat().st_nlink == 2
+
+    target.write_text("modified")
+    assert restore_manager._restore_file(src_file, target, force=True)
+    assert target.read_text() == "[user]"
+
+
+def test_validate_restore_compares_content(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test that validation reads files whose size and mtime match the backup."""
+    src_file = tmp_path / "saved" / "cursor" / ".cursor" / ".cursorrules"
+    src_file.parent.mkdir(parents=True)
+    src_file.write_text("backup")
+    target = tmp_path / "target" / ".cursor" / ".cursorrules"
+    target.parent.mkdir(parents=True)
+    target.write_text("change")
+    shutil.copystat(src_file, target)
+
+    is_valid, results = restore_manager.validate_restore(
+        tmp_path / "saved", tmp_path / "target", ["cursor"]
+    )
+    assert not is_valid
+    assert [path for path, _ in results["cursor"]["failed"]] == [target]
+
+
+def test_validate_restore_force_full_reads_directories(
+    restore_manager: RestoreManager, tmp_path: Path
+) -> None:
+    """Test that a full validation compares files inside restored directories."""
+    src_file = tmp_path / "saved" / "cursor" / ".cursor" / "rules" / "test.mdc"
+    src_file.parent.mkdir(parents=True)
+    src_file.write_text("backup")
+    target = tmp_path / "target" / ".cursor" / "rules" / "test.mdc"
+    target.parent.mkdir(parents=True)
+    target.write_text("change")
+    shutil.copystat(src_file, target)
+
+    args = (tmp_path / "saved", tmp_path / "target", ["cursor"])
+    assert restore_manager.validate_restore(*args)[0]
+    assert not restore_manager.validate_restore(*args, force_full=True)[0]
+
+
+def _unsupported(error: int) -> Callable[..., int]:
+    """Build a stand-in for a kernel copy call that fails with the given errno."""
+
+    def fail(*args: object) -> int:
+        raise OSError(error, os.strerror(error))
+
+    return fail
+
+
+def test_copy_large_file(tmp_path: Path) -> None:
+    """Test copying a file of at least 1 MiB with its metadata."""
+    src = tmp_path / "large.bin"
+    src.write_bytes(os.urandom(1024 * 1024 + 17))
+    dst = tmp_path / "copy.bin"
+
+    restore._copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_copy_falls_back_to_sendfile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sendfile is used when copy_file_range is not supported."""
+    src = tmp_path / "large.bin"
+    src.write_bytes(os.urandom(1024 * 1024))
+    dst = tmp_path / "copy.bin"
+    sent: List[Tuple[int, ...]] = []
+    sendfile = os.sendfile
+
+    def spy(*args: int) -> int:
+        sent.append(args)
+        return sendfile(*args)
+
+    monkeypatch.setattr(restore, "_clone", lambda src_fd, dst_fd: False)
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.EXDEV), raising=False)
+    monkeypatch.setattr(os, "sendfile", spy)
+
+    restore._copy(src, dst)
+    assert sent
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_without_kernel_copy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that files are copied through user space when no kernel copy works."""
+    src = tmp_path / "large.bin"
+    src.write_bytes(os.urandom(3 * 1024 * 1024 + 5))
+    dst = tmp_path / "copy.bin"
+    monkeypatch.setattr(restore, "_clone", lambda src_fd, dst_fd: False)
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EINVAL), raising=False)
+
+    restore._copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+    with pytest.raises(FileExistsError):
+        restore._copy(src, dst, exclusive=True)
+
+
+def test_same_content_large_files(tmp_path: Path) -> None:
+    """Test comparing files large enough to be mapped."""
+    data = os.urandom(restore._MMAP_THRESHOLD * 3)
+    a = tmp_path / "a.bin"
+    b = tmp_path / "b.bin"
+    a.write_bytes(data)
+    b.write_bytes(data)
+    assert restore._same_content(a, b, len(data))
+
+    b.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    assert not restore._same_content(a, b, len(data))
+
+
+def _saved_gitconfig(restore_manager: RestoreManager) -> Path:
+    """Create a backup holding only a git config file."""
+    saved = Path(restore_manager.config.get("backup_dir")) / "proj" / "main" / "20250101-000000"
+    src_file = saved / "git" / ".gitconfig"
+    src_file.parent.mkdir(parents=True)
+    src_file.write_text("[user]\n\tname = Test User")
+    return src_file
+
+
+def test_restore_hardlink(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test restoring files as hardlinks to the backup."""
+    src_file = _saved_gitconfig(restore_manager)
+
+    assert restore_manager.restore("proj", tmp_path / "target", ["git"], hardlink=True)
+    target = tmp_path / "target" / ".gitconfig"
+    assert os.path.samefile(target, src_file)
+
+
+def test_restore_hardlink_falls_back_to_copy(
+    restore_manager: RestoreManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that files are copied when they cannot be linked."""
+    src_file = _saved_gitconfig(restore_manager)
+    monkeypatch.setattr(os, "link", _unsupported(errno.EXDEV))
+
+    assert restore_manager.restore("proj", tmp_path / "target", ["git"], hardlink=True)
+    target = tmp_path / "target" / ".gitconfig"
+    assert not os.path.samefile(target, src_file)
+    assert target.read_text() == src_file.read_text()
+
+
+def test_restore_and_validate_programs_concurrently(
+    restore_manager: RestoreManager, tmp_path: Path
+) -> None:
+    """Test restoring several files and validating several programs at once."""
+    saved = tmp_path / "saved"
+    for rel_path in (
+        "git/.gitconfig",
+        "git/.gitignore",
+        "vscode/.vscode/settings.json",
+        "vscode/.vscode/extensions.json",
+        "cursor/.cursor/.cursorrules",
+    ):
+        (saved / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (saved / rel_path).write_text(f"saved {rel_path}")
+    target = tmp_path / "target"
+    programs = ["git", "vscode", "cursor"]
+
+    for program in programs:
+        assert restore_manager.restore_program(program, saved, target).success
+    assert (target / ".gitignore").read_text() == "saved git/.gitignore"
+
+    events = list(restore_manager.iter_validation_events(saved, target, programs))
+    assert [event.program for event in events if event.status == "started"] == programs
+    # Each program's events stay together, in the order the programs were given
+    assert [program for program, _ in itertools.groupby(event.program for event in events)] == (
+        programs
+    )
+    assert all(event.status != "failed" for event in events)
+
+    (target / ".gitconfig").write_text("changed content")
+    is_valid, results = restore_manager.validate_restore(saved, target, programs)
+    assert not is_valid
+    assert [path for path, _ in results["git"]["failed"]] == [target / ".gitconfig"]
+    assert not results["vscode"]["failed"] and not results["cursor"]["failed"]
+
+
+def test_validate_restored_symlinked_file(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test that a symlinked file in a backup validates once restored as a regular file."""
+    outside = tmp_path / "shared.mdc"
+    outside.write_text("shared rule")
+    rules = tmp_path / "saved" / "cursor" / ".cursor" / "rules"
+    rules.mkdir(parents=True)
+    (rules / "test.mdc").write_text("test")
+    (rules / "shared.mdc").symlink_to(outside)
+    target = tmp_path / "target"
+
+    assert restore_manager.restore_program("cursor", tmp_path / "saved", target).success
+    restored = target / ".cursor" / "rules" / "shared.mdc"
+    assert not restored.is_symlink()
+    assert restored.read_text() == "shared rule"
+
+    is_valid, _ = restore_manager.validate_restore(tmp_path / "saved", target, ["cursor"])
+    assert is_valid
+
+
 def test_check_conflicts_empty(
     restore_manager: RestoreManager, temp_git_repo: Path, backup_with_files: Path
 ) -> None:
@@ -148,6 +427,109 @@ def test_check_conflicts(
     assert any(".cursor" in str(p[1]) for p in conflicts)
 
 
+def _saved_and_target(tmp_path: Path) -> Tuple[Path, GitRepository]:
+    """Create a backup and a target directory holding the same cursor, vscode and git files."""
+    saved = tmp_path / "saved"
+    target = tmp_path / "target"
+    for program, rel_path in (
+        ("cursor", ".cursor/.cursorrules"),
+        ("vscode", ".vscode/settings.json"),
+        ("git", ".gitconfig"),
+        ("git", ".gitignore"),
+    ):
+        for path in (saved / program / rel_path, target / rel_path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"saved {rel_path}")
+    return saved, GitRepository(target)
+
+
+def test_check_conflicts_programs(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test checking conflicts for selected programs only."""
+    saved, repo = _saved_and_target(tmp_path)
+
+    conflicts = restore_manager.check_conflicts(repo, saved, programs=["vscode"])
+    assert {target for target, _ in conflicts} == {
+        repo.path / ".vscode",
+        repo.path / ".vscode" / "settings.json",
+    }
+    assert all(saved / "vscode" in backup.parents for _, backup in conflicts)
+
+    assert restore_manager.check_conflicts(repo, saved, programs=[]) == set()
+    assert restore_manager.check_conflicts(repo, saved, programs=["unknown"]) == set()
+
+
+def test_check_conflicts_ignore_identical(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test that targets matching the backup are left out when asked."""
+    saved, repo = _saved_and_target(tmp_path)
+    # Same size as the backup file, so the contents have to be compared
+    (repo.path / ".gitignore").write_text("SAVED .gitignore")
+
+    conflicts = restore_manager.check_conflicts(repo, saved, programs=["git"])
+    assert {target for target, _ in conflicts} == {
+        repo.path / ".gitconfig",
+        repo.path / ".gitignore",
+    }
+
+    conflicts = restore_manager.check_conflicts(
+        repo, saved, ignore_identical=True, programs=["git"]
+    )
+    assert conflicts == {(repo.path / ".gitignore", saved / "git" / ".gitignore")}
+
+
+def test_iter_program_paths(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test that iter_program_paths yields the paths of get_program_paths, files first."""
+    _, repo = _saved_and_target(tmp_path)
+
+    paths = list(restore_manager.iter_program_paths(repo, "cursor"))
+    assert set(paths) == restore_manager.get_program_paths(repo, "cursor")
+    assert len(paths) == len(set(paths))
+    # Glob patterns are yielded as configured, and directories come after files
+    assert repo.path / ".cursor/rules/*.mdc" in paths
+    assert paths[-1] == repo.path / ".cursor"
+
+    assert list(restore_manager.iter_program_paths(repo, "unknown")) == []
+
+
+def test_iter_validation_events_fields(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test the fields of the events yielded while validating."""
+    saved, repo = _saved_and_target(tmp_path)
+    (repo.path / ".gitignore").write_text("changed")
+
+    events = list(restore_manager.iter_validation_events(saved, repo.path, ["git"]))
+    assert events == [
+        ValidationEvent("git", "started", None, None),
+        ValidationEvent("git", "success", repo.path / ".gitconfig", None),
+        ValidationEvent(
+            "git",
+            "failed",
+            repo.path / ".gitignore",
+            "Content mismatch (backup: 16 bytes, target: 7 bytes)",
+        ),
+    ]
+    assert (events[2].program, events[2].status, events[2].path) == (
+        "git",
+        "failed",
+        repo.path / ".gitignore",
+    )
+
+
+def test_restore_program_outcome(restore_manager: RestoreManager, tmp_path: Path) -> None:
+    """Test the outcome reported by restore_program."""
+    saved, _ = _saved_and_target(tmp_path)
+    target = tmp_path / "fresh"
+
+    outcome = restore_manager.restore_program("git", saved, target)
+    assert outcome == RestoreOutcome(success=True, skipped=False)
+
+    # Existing targets are skipped without force
+    outcome = restore_manager.restore_program("git", saved, target)
+    assert not outcome.success
+    assert outcome.skipped
+
+    outcome = restore_manager.restore_program("git", saved, target, force=True)
+    assert (outcome.success, outcome.skipped) == (True, False)
+
+
 def test_restore_conflicts(
     restore_manager: RestoreManager, temp_git_repo: Path, backup_with_files: Path
 ) -> None:
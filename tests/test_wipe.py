@@ -1,9 +1,11 @@
 """Test wipe functionality."""
 
+import shutil
 from pathlib import Path
 
 import pytest
 
+from dotfiles.core import wipe
 from dotfiles.core.config import Config
 from dotfiles.core.repository import GitRepository
 from dotfiles.core.wipe import WipeManager
@@ -112,3 +114,92 @@ def test_wipe_force(wipe_manager: WipeManager, temp_git_repo: Path) -> None:
     assert (temp_git_repo / ".cursor" / ".cursorrules").exists()
     assert (temp_git_repo / ".vscode" / "settings.json").exists()
     assert (temp_git_repo / ".gitconfig").exists()
+
+
+def test_wipe_nested_directories_keeps_symlink_targets(
+    wipe_manager: WipeManager, temp_git_repo: Path
+) -> None:
+    """Test wiping nested directories without following symlinks."""
+    outside = temp_git_repo / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+
+    rules_dir = temp_git_repo / ".cursor" / "rules" / "nested"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "test.mdc").write_text("test")
+    (temp_git_repo / ".cursor" / "snippets").mkdir()
+    (temp_git_repo / ".cursor" / "snippets" / "snippet.json").write_text("{}")
+    (temp_git_repo / ".cursor" / "rules" / "link").symlink_to(outside, target_is_directory=True)
+
+    assert wipe_manager.wipe(GitRepository(temp_git_repo), programs=["cursor"], testing=True)
+
+    assert not (temp_git_repo / ".cursor" / "rules").exists()
+    assert not (temp_git_repo / ".cursor" / "snippets").exists()
+    assert (outside / "keep.txt").read_text() == "keep"
+
+
+def _make_large_tree(root: Path) -> Path:
+    """Create a .cursor directory with more entries than rm is used for."""
+    cursor_dir = root / ".cursor"
+    cursor_dir.mkdir()
+    for index in range(wipe._RM_THRESHOLD + 10):
+        (cursor_dir / f"ext{index}").mkdir()
+        (cursor_dir / f"ext{index}" / "package.json").write_text("{}")
+    return cursor_dir
+
+
+def test_wipe_large_directory(wipe_manager: WipeManager, tmp_path: Path) -> None:
+    """Test wiping a directory large enough to be handed to rm."""
+    cursor_dir = _make_large_tree(tmp_path)
+
+    assert wipe_manager.wipe_program(GitRepository(tmp_path), "cursor")
+    assert not cursor_dir.exists()
+
+
+def test_wipe_large_directory_rm_failure(
+    wipe_manager: WipeManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failing rm is reported instead of ignored."""
+    cursor_dir = _make_large_tree(tmp_path)
+    failing = shutil.which("false")
+    if failing is None:
+        pytest.skip("no false binary to stand in for rm")
+    monkeypatch.setattr(wipe.shutil, "which", lambda name: failing)
+
+    assert not wipe_manager.wipe_program(GitRepository(tmp_path), "cursor")
+    assert cursor_dir.exists()
+
+
+def test_assign_roots_gives_each_path_one_owner(tmp_path: Path) -> None:
+    """Test that overlapping program paths are wiped by a single program."""
+    cursor_dir = tmp_path / ".cursor"
+    (cursor_dir / "rules").mkdir(parents=True)
+    (cursor_dir / "rules" / "test.mdc").write_text("test")
+    gitconfig = tmp_path / ".gitconfig"
+    gitconfig.write_text("[user]")
+
+    owned = wipe._assign_roots(
+        {
+            "cursor": {cursor_dir: True, cursor_dir / "rules": True},
+            "rules": {cursor_dir / "rules": True, cursor_dir / "rules" / "test.mdc": False},
+            "git": {gitconfig: False},
+        }
+    )
+    assert owned == {"cursor": {cursor_dir: True}, "rules": {}, "git": {gitconfig: False}}
+
+
+def test_wipe_symlinked_program_directory_keeps_target(
+    wipe_manager: WipeManager, tmp_path: Path
+) -> None:
+    """Test that wiping a symlinked .cursor removes the link, not the linked directory."""
+    outside = tmp_path / "shared-cursor"
+    (outside / "rules").mkdir(parents=True)
+    (outside / "rules" / "test.mdc").write_text("keep")
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    (repo_dir / ".cursor").symlink_to(outside, target_is_directory=True)
+
+    assert wipe_manager.wipe(GitRepository(repo_dir), programs=["cursor"], testing=True)
+
+    assert not (repo_dir / ".cursor").is_symlink()
+    assert (outside / "rules" / "test.mdc").read_text() == "keep"
@@ -89,3 +89,18 @@ def test_zip_export_creates_output_dirs(tmp_path: Path) -> None:
     exporter.export()
 
     assert output_path.exists()
+
+
+def test_zip_export_stores_compressed_files(tmp_path: Path) -> None:
+    """Test that already-compressed files are stored and others deflated."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "icon.PNG").write_bytes(b"\x89PNG" + b"\x00" * 100)
+    (source_dir / "settings.json").write_text("{}")
+
+    output_path = tmp_path / "output.zip"
+    ZipExporter(str(source_dir), str(output_path)).export()
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.getinfo("icon.PNG").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("settings.json").compress_type == zipfile.ZIP_DEFLATED